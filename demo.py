@@ -129,8 +129,7 @@ def create_sample_files():
     
     # Create uploads directory
     uploads_dir = "sample_uploads"
-    if not os.path.exists(uploads_dir):
-        os.makedirs(uploads_dir)
+    os.makedirs(uploads_dir, exist_ok=True)
     
     # Create sample CSV for participant import
     sample_csv = f"""name,email,phone,organization,industry,role,dietary_restrictions
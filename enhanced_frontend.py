@@ -25,8 +25,7 @@ API_BASE_URL = "http://localhost:8000/api/v1"
 # File Upload Helper Functions
 def save_uploaded_file(uploaded_file, folder="uploads"):
     """Save uploaded file and return file info"""
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
     
     file_path = os.path.join(folder, uploaded_file.name)
     with open(file_path, "wb") as f:
@@ -820,13 +819,13 @@ def show_media_gallery_page():
         with col1:
             st.metric("📸 Total Media", len(all_media))
         with col2:
-            photos = len([m for m in all_media if m['type'] == 'Photo'])
+            photos = sum(1 for m in all_media if m['type'] == 'Photo')
             st.metric("📷 Photos", photos)
         with col3:
-            videos = len([m for m in all_media if m['type'] == 'Video'])
+            videos = sum(1 for m in all_media if m['type'] == 'Video')
             st.metric("🎥 Videos", videos)
         with col4:
-            uploaded = len([m for m in all_media if m.get('source') == 'uploaded'])
+            uploaded = sum(1 for m in all_media if m.get('source') == 'uploaded')
             st.metric("📤 Uploaded", uploaded)
         
         # Display media in grid
@@ -6,25 +6,13 @@ Team-based development with separate modules for each navigation section
 import streamlit as st
 import sys
 import os
+import time
 
 # Add modules to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
 
-# Import all modules
+# Shared utilities; page modules are imported on first visit in route_to_page
 from modules.utils import *
-from modules.dashboard import show_role_dashboard
-from modules.event_setup import show_event_setup_module
-from modules.certificates import show_certificates_page
-from modules.media_gallery import show_media_gallery_page
-from modules.vendors import show_vendors_page
-from modules.participants import show_participants_module
-from modules.budget import show_budget_module
-from modules.settings import show_settings_page
-from modules.volunteers import show_volunteers_module
-from modules.booths import show_booths_module
-from modules.workflows import show_workflows_page
-from modules.feedback import show_feedback_page
-from modules.analytics import show_analytics_module
 
 # Page Configuration
 st.set_page_config(
@@ -203,32 +191,46 @@ def route_to_page(page, user_role):
     """Route to the appropriate page/module"""
     try:
         if page == "🏠 Dashboard":
+            from modules.dashboard import show_role_dashboard
             show_role_dashboard(user_role)
         elif page == "� Event Setup":
+            from modules.event_setup import show_event_setup_module
             show_event_setup_module()
         elif page == "�🎓 Certificates" or page == "🎓 My Certificates":
+            from modules.certificates import show_certificates_page
             show_certificates_page()
         elif page == "📸 Media Gallery":
+            from modules.media_gallery import show_media_gallery_page
             show_media_gallery_page()
         elif page == "🏭 Vendors" or page == "🏭 Vendor Portal":
+            from modules.vendors import show_vendors_page
             show_vendors_page()
         elif page == "👥 Participants":
+            from modules.participants import show_participants_module
             show_participants_module()
         elif page == "🤝 Volunteers":
+            from modules.volunteers import show_volunteers_module
             show_volunteers_module()
         elif page == "💰 Budget":
+            from modules.budget import show_budget_module
             show_budget_module()
         elif page == "🏢 Booths":
+            from modules.booths import show_booths_module
             show_booths_module()
         elif page == "🔄 Workflows":
+            from modules.workflows import show_workflows_page
             show_workflows_page()
         elif page == "📝 Feedback":
+            from modules.feedback import show_feedback_page
             show_feedback_page()
         elif page == "📊 Analytics" or page == "📊 System Analytics":
+            from modules.analytics import show_analytics_module
             show_analytics_module()
         elif page == "⚙️ Settings" or page == "⚙️ Profile" or page == "⚙️ System Settings":
+            from modules.settings import show_settings_page
             show_settings_page()
         elif page == "👥 User Management":
+            from modules.settings import show_settings_page
             show_settings_page()  # Redirect to settings for user management
         else:
             st.error(f"Page '{page}' not found!")
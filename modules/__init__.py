@@ -3,15 +3,76 @@ EventIQ Modules Package
 Contains all navigation modules for the EventIQ Management System
 """
 
-# Import all modules
+import importlib
+
 from .utils import *
-from .dashboard import *
-from .certificates import *
-from .media_gallery import *
-from .vendors import *
-from .participants import *
-from .budget import *
-from .settings import *
+
+# Page modules re-exported at package level with the public names the package used to star-import from them;
+# each is imported on first attribute access (PEP 562)
+_PAGE_EXPORTS = {
+    "dashboard": (
+        "show_role_dashboard", "show_organizer_dashboard", "show_volunteer_dashboard",
+        "show_participant_dashboard", "show_vendor_dashboard", "show_admin_dashboard",
+        "show_organizer_metrics", "show_organizer_quick_actions", "show_recent_activities",
+        "show_volunteer_stats", "show_certificate_status", "show_volunteer_quick_actions",
+        "show_event_information", "show_participant_stats", "show_participant_quick_actions",
+        "show_vendor_stats", "show_vendor_quick_actions", "show_admin_stats", "show_admin_quick_actions"
+    ),
+    "certificates": (
+        "show_certificates_page", "show_certificates_registry", "show_certificate_generation",
+        "show_individual_certificate_generation", "show_bulk_certificate_generation",
+        "show_certificate_analytics", "show_certificate_eligibility_chart", "show_hours_distribution_chart",
+        "generate_certificate_content"
+    ),
+    "media_gallery": (
+        "show_media_gallery_page", "show_media_gallery", "show_media_upload", "show_media_statistics",
+        "show_live_stream_management", "get_sample_media", "get_combined_media", "apply_media_filters",
+        "show_gallery_overview", "show_media_grid", "show_media_actions", "show_upload_interface",
+        "display_uploaded_files_preview", "show_sample_file_buttons", "load_sample_images",
+        "load_sample_videos", "show_upload_metadata_form", "show_save_media_button",
+        "process_uploaded_files", "show_media_metrics", "show_media_charts", "show_top_contributors",
+        "show_storage_breakdown", "show_active_streams", "show_stream_controls", "show_stream_settings",
+        "show_chat_moderation"
+    ),
+    "vendors": (
+        "show_vendors_page", "show_vendor_directory", "show_add_vendor", "show_vendor_analytics",
+        "show_payment_management", "show_vendor_communications", "get_vendor_data", "apply_vendor_filters",
+        "show_vendor_actions", "show_individual_vendor_management", "show_basic_vendor_form",
+        "show_vendor_documents_form", "show_sample_document_buttons", "show_vendor_save_button",
+        "save_new_vendor", "show_vendor_metrics", "show_vendor_charts", "show_payment_analysis",
+        "show_payment_overview", "show_payment_tracking", "show_payment_actions",
+        "show_individual_payment_processing", "show_send_messages", "get_message_recipients",
+        "handle_message_attachments", "handle_send_message", "store_vendor_message", "show_message_history",
+        "show_message_templates", "get_message_templates"
+    ),
+    "participants": (
+        "show_participants_module", "show_participants_list", "show_add_participant", "show_bulk_import",
+        "show_participants_analytics", "get_sample_participants_data", "get_participants_csv_template"
+    ),
+    "budget": (
+        "show_budget_module", "show_budget_setup", "show_budget_analytics", "show_budget_overview",
+        "show_expenses_list", "show_add_expense", "show_receipts_management", "get_sample_expenses_data"
+    ),
+    "settings": (
+        "show_settings_page", "show_general_settings", "show_system_configuration",
+        "show_email_configuration", "show_configuration_files", "show_config_upload", "show_logo_upload",
+        "show_theme_settings", "show_user_management", "show_active_users", "show_user_actions",
+        "show_bulk_user_import", "show_role_management", "show_security_settings", "show_password_policy",
+        "show_security_features", "show_security_logs", "show_notification_settings",
+        "show_email_notifications", "show_system_notifications", "show_notification_templates",
+        "get_sample_config", "get_users_data", "get_user_template_data", "get_security_logs"
+    ),
+}
+_EXPORTS = {name: module_name for module_name, names in _PAGE_EXPORTS.items() for name in names}
+
+def __getattr__(name):
+    """Resolve page modules and their exported names lazily so importing the package does not load every page"""
+    if name in _PAGE_EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
 
 # Version information
 __version__ = "1.0.0"
@@ -4,6 +4,7 @@ Team Member: [Analytics Team]
 """
 
 from .utils import *
+import plotly.express as px
 
 def show_analytics_module():
     """Analytics dashboard interface"""
@@ -4,6 +4,7 @@ Team Member: [Booths Team]
 """
 
 from .utils import *
+import plotly.express as px
 
 def show_booths_module():
     """Booths management interface"""
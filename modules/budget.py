@@ -4,6 +4,8 @@ Team Member: [Budget Management Team]
 """
 
 from .utils import *
+import plotly.express as px
+import plotly.graph_objects as go
 
 def show_budget_module():
     """Budget management interface"""
@@ -4,13 +4,18 @@ Team Member: [Certificate Management Team]
 """
 
 from .utils import *
+import plotly.express as px
 
 def show_certificates_page():
     """Complete certificates page"""
     st.markdown("## 🎓 Certificate Management System")
     
+    # Fetch everything the tabs need at once instead of one serial call per section
+    cert_stats, certificates, volunteers = make_api_requests(
+        ["/certificates/stats", "/certificates/", "/volunteers/"]
+    )
+    
     # Certificate statistics
-    cert_stats = make_api_request("/certificates/stats")
     if cert_stats:
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -26,18 +31,17 @@ def show_certificates_page():
     tab1, tab2, tab3 = st.tabs(["📋 All Certificates", "🎓 Generate", "📊 Analytics"])
     
     with tab1:
-        show_certificates_registry()
+        show_certificates_registry(certificates)
     
     with tab2:
-        show_certificate_generation()
+        show_certificate_generation(volunteers)
     
     with tab3:
-        show_certificate_analytics()
+        show_certificate_analytics(cert_stats, volunteers)
 
-def show_certificates_registry():
+def show_certificates_registry(certificates):
     """Display certificate registry"""
     st.markdown("### 📋 Certificate Registry")
-    certificates = make_api_request("/certificates/")
     if certificates and "certificates" in certificates:
         if certificates["certificates"]:
             cert_df = pd.DataFrame(certificates["certificates"])
@@ -70,21 +74,20 @@ def show_certificates_registry():
     else:
         st.error("Could not load certificates data")
 
-def show_certificate_generation():
+def show_certificate_generation(volunteers):
     """Show certificate generation interface"""
     st.markdown("### 🎓 Generate Certificates")
     
     col1, col2 = st.columns(2)
     with col1:
-        show_individual_certificate_generation()
+        show_individual_certificate_generation(volunteers)
     
     with col2:
         show_bulk_certificate_generation()
 
-def show_individual_certificate_generation():
+def show_individual_certificate_generation(volunteers):
     """Individual certificate generation"""
     st.markdown("#### 👤 Individual Certificate")
-    volunteers = make_api_request("/volunteers/")
     if volunteers and "volunteers" in volunteers:
         vol_options = {f"{v['full_name']} ({v['total_hours']}h)": v['id'] 
                      for v in volunteers["volunteers"] if v['total_hours'] >= 5}
@@ -136,11 +139,10 @@ def show_bulk_certificate_generation():
             if "eligible_volunteers" in result:
                 st.write(f"Generated for {len(result['eligible_volunteers'])} volunteers")
 
-def show_certificate_analytics():
+def show_certificate_analytics(cert_stats, volunteers):
     """Display certificate analytics"""
     st.markdown("### 📊 Certificate Analytics")
     
-    cert_stats = make_api_request("/certificates/stats")
     if cert_stats:
         # Charts and analytics
         col1, col2 = st.columns(2)
@@ -149,7 +151,7 @@ def show_certificate_analytics():
             show_certificate_eligibility_chart(cert_stats)
         
         with col2:
-            show_hours_distribution_chart()
+            show_hours_distribution_chart(volunteers)
 
 def show_certificate_eligibility_chart(cert_stats):
     """Show certificate eligibility pie chart"""
@@ -165,9 +167,8 @@ def show_certificate_eligibility_chart(cert_stats):
         )
         st.plotly_chart(fig, use_container_width=True)
 
-def show_hours_distribution_chart():
+def show_hours_distribution_chart(volunteers):
     """Show volunteer hours distribution histogram"""
-    volunteers = make_api_request("/volunteers/")
     if volunteers and "volunteers" in volunteers:
         hours_data = [v['total_hours'] for v in volunteers["volunteers"]]
         fig = px.histogram(x=hours_data, title='Volunteer Hours Distribution', 
@@ -15,6 +15,19 @@ from modules.models import Event, create_event
 from modules.services.file_service import FileService
 from modules.utils import show_success_animation
 
+# Sample recent activity for the event dashboard, built once at import
+_ACTIVITIES = [
+    {"time": "2 hours ago", "activity": "New registration: John Smith", "type": "registration"},
+    {"time": "5 hours ago", "activity": "Budget updated by Finance Team", "type": "budget"},
+    {"time": "1 day ago", "activity": "Venue contract signed", "type": "contract"},
+    {"time": "2 days ago", "activity": "Speaker confirmed: Dr. Jane Doe", "type": "speaker"},
+    {"time": "3 days ago", "activity": "Marketing campaign launched", "type": "marketing"}
+]
+_ACTIVITY_ICONS = {"registration": "👥", "budget": "💰", "contract": "📋", "speaker": "🎤", "marketing": "📢"}
+_ACTIVITY_DF = pd.DataFrame(
+    [{"": _ACTIVITY_ICONS.get(a["type"], "📝"), "When": a["time"], "What": a["activity"]} for a in _ACTIVITIES]
+).set_index("")
+
 def show_event_setup_module():
     """Main event setup interface for corporate IT events"""
     st.markdown("# 🎯 Corporate IT Event Setup & Management")
@@ -841,17 +854,7 @@ def show_event_dashboard():
     
     # Recent activity
     st.markdown("#### 📝 Recent Activity")
-    activities = [
-        {"time": "2 hours ago", "activity": "New registration: John Smith", "type": "registration"},
-        {"time": "5 hours ago", "activity": "Budget updated by Finance Team", "type": "budget"},
-        {"time": "1 day ago", "activity": "Venue contract signed", "type": "contract"},
-        {"time": "2 days ago", "activity": "Speaker confirmed: Dr. Jane Doe", "type": "speaker"},
-        {"time": "3 days ago", "activity": "Marketing campaign launched", "type": "marketing"}
-    ]
-    
-    for activity in activities:
-        icon = {"registration": "👥", "budget": "💰", "contract": "📋", "speaker": "🎤", "marketing": "📢"}.get(activity['type'], "📝")
-        st.markdown(f"{icon} **{activity['time']}** - {activity['activity']}")
+    st.table(_ACTIVITY_DF)
     
     # Quick actions
     st.markdown("#### ⚡ Quick Actions")
@@ -4,6 +4,119 @@ Team Member: [Media Management Team]
 """
 
 from .utils import *
+import plotly.express as px
+from .models import MediaItem
+import html
+
+# Sample media shown alongside uploads; shared read-only across reruns
+_SAMPLE_MEDIA = (
+    MediaItem(
+        file_name="Registration Desk Setup",
+        file_type="Photo",
+        booth="Main Entrance",
+        upload_date=datetime(2025, 1, 30),
+        uploader_name="John Smith",
+        size_label="2.4 MB",
+        downloads=15,
+        likes=8,
+        tags=["registration", "setup", "entrance"],
+        source="sample"
+    ),
+    MediaItem(
+        file_name="Information Booth Team",
+        file_type="Photo",
+        booth="Information Booth",
+        upload_date=datetime(2025, 1, 30),
+        uploader_name="Sarah Johnson",
+        size_label="3.1 MB",
+        downloads=23,
+        likes=12,
+        tags=["team", "volunteers", "information"],
+        source="sample"
+    ),
+    MediaItem(
+        file_name="Main Stage Performance",
+        file_type="Video",
+        booth="Main Stage",
+        upload_date=datetime(2025, 1, 29),
+        uploader_name="Mike Wilson",
+        size_label="45.2 MB",
+        downloads=8,
+        likes=25,
+        tags=["performance", "stage", "entertainment"],
+        source="sample"
+    ),
+    MediaItem(
+        file_name="Volunteer Training Session",
+        file_type="Photo",
+        booth="Conference Room",
+        upload_date=datetime(2025, 1, 29),
+        uploader_name="Alice Brown",
+        size_label="1.8 MB",
+        downloads=12,
+        likes=6,
+        tags=["training", "volunteers", "preparation"],
+        source="sample"
+    ),
+    MediaItem(
+        file_name="Food Court Opening",
+        file_type="Photo",
+        booth="Food Court",
+        upload_date=datetime(2025, 1, 30),
+        uploader_name="David Lee",
+        size_label="2.7 MB",
+        downloads=18,
+        likes=14,
+        tags=["food", "opening", "vendors"],
+        source="sample"
+    ),
+    MediaItem(
+        file_name="Exhibition Hall Overview",
+        file_type="Video",
+        booth="Exhibition Hall",
+        upload_date=datetime(2025, 1, 30),
+        uploader_name="Emma Davis",
+        size_label="38.5 MB",
+        downloads=6,
+        likes=9,
+        tags=["exhibition", "overview", "booths"],
+        source="sample"
+    )
+)
+
+# MediaItem fields as named in the gallery DataFrame and card templates
+_MEDIA_COLUMNS = {"file_name": "name", "file_type": "type", "uploader_name": "photographer", "size_label": "size"}
+
+# Top contributors table, built once at import
+_CONTRIB_DF = pd.DataFrame([
+    {"Name": "Sarah Johnson", "Uploads": 8, "Downloads": 45, "Likes": 32},
+    {"Name": "Mike Wilson", "Uploads": 6, "Downloads": 38, "Likes": 28},
+    {"Name": "Alice Brown", "Uploads": 4, "Downloads": 22, "Likes": 15},
+    {"Name": "John Smith", "Uploads": 3, "Downloads": 28, "Likes": 18},
+    {"Name": "David Lee", "Uploads": 2, "Downloads": 15, "Likes": 12},
+])
+
+# Media card HTML, formatted once per card with format_map and laid out in a two-column grid
+_CARD_TMPL = """<div style="border: 2px solid {border_color}; border-radius: 8px; padding: 15px; margin: 10px 0; background: white;">
+    <h4>📸 {name} <span style="background: {border_color}; color: white; padding: 2px 6px; border-radius: 3px; font-size: 10px;">{source_badge}</span></h4>
+    <p><strong>Type:</strong> {type} | <strong>Size:</strong> {size}</p>
+    <p><strong>Location:</strong> {booth}</p>
+    <p><strong>Date:</strong> {date}</p>
+    <p><strong>Photographer:</strong> {photographer}</p>
+    <p><strong>Tags:</strong> {tags_str}</p>
+    <p>👁️ {downloads} downloads | ❤️ {likes} likes</p>{desc_block}
+</div>
+"""
+# Border color and badge per media source, baked into one card template each
+_BADGE = {"uploaded": ("#4CAF50", "🆕 NEW"), "sample": ("#ddd", "📋 SAMPLE")}
+_CARD_TMPLS = {
+    source: _CARD_TMPL.replace("{border_color}", color).replace("{source_badge}", badge)
+    for source, (color, badge) in _BADGE.items()
+}
+_CARD_DESC_TMPL = "<p><strong>Description:</strong> {description}</p>"
+_GRID_TMPL = """<div style="display: grid; grid-template-columns: repeat(2, 1fr); column-gap: 15px;">
+{cards}</div>
+"""
 
 def show_media_gallery_page():
     """Enhanced media gallery and upload page"""
@@ -39,11 +152,11 @@ def show_media_gallery():
     # Get combined media (sample + uploaded)
     all_media = get_combined_media()
     
-    # Apply filters
-    filtered_media = apply_media_filters(all_media, filter_booth, filter_type)
+    # Apply filters and count media types
+    filtered_media, counts = apply_media_filters(all_media, filter_booth, filter_type)
     
     # Display media statistics
-    show_gallery_overview(all_media)
+    show_gallery_overview(counts)
     
     # Display media in grid
     show_media_grid(filtered_media)
@@ -90,190 +203,172 @@ def show_live_stream_management():
     show_chat_moderation()
 
 def get_sample_media():
-    """Get sample media data"""
-    return [
-        {
-            "name": "Registration Desk Setup",
-            "type": "Photo",
-            "booth": "Main Entrance",
-            "date": "2025-01-30",
-            "photographer": "John Smith",
-            "size": "2.4 MB",
-            "downloads": 15,
-            "likes": 8,
-            "tags": ["registration", "setup", "entrance"],
-            "source": "sample"
-        },
-        {
-            "name": "Information Booth Team",
-            "type": "Photo",
-            "booth": "Information Booth",
-            "date": "2025-01-30",
-            "photographer": "Sarah Johnson",
-            "size": "3.1 MB",
-            "downloads": 23,
-            "likes": 12,
-            "tags": ["team", "volunteers", "information"],
-            "source": "sample"
-        },
-        {
-            "name": "Main Stage Performance",
-            "type": "Video",
-            "booth": "Main Stage",
-            "date": "2025-01-29",
-            "photographer": "Mike Wilson",
-            "size": "45.2 MB",
-            "downloads": 8,
-            "likes": 25,
-            "tags": ["performance", "stage", "entertainment"],
-            "source": "sample"
-        },
-        {
-            "name": "Volunteer Training Session",
-            "type": "Photo",
-            "booth": "Conference Room",
-            "date": "2025-01-29",
-            "photographer": "Alice Brown",
-            "size": "1.8 MB",
-            "downloads": 12,
-            "likes": 6,
-            "tags": ["training", "volunteers", "preparation"],
-            "source": "sample"
-        },
-        {
-            "name": "Food Court Opening",
-            "type": "Photo",
-            "booth": "Food Court",
-            "date": "2025-01-30",
-            "photographer": "David Lee",
-            "size": "2.7 MB",
-            "downloads": 18,
-            "likes": 14,
-            "tags": ["food", "opening", "vendors"],
-            "source": "sample"
-        },
-        {
-            "name": "Exhibition Hall Overview",
-            "type": "Video",
-            "booth": "Exhibition Hall",
-            "date": "2025-01-30",
-            "photographer": "Emma Davis",
-            "size": "38.5 MB",
-            "downloads": 6,
-            "likes": 9,
-            "tags": ["exhibition", "overview", "booths"],
-            "source": "sample"
-        }
-    ]
+    """Get sample media data (read-only)"""
+    return _SAMPLE_MEDIA
+
+def _media_frame(media_items):
+    """Build a media DataFrame from MediaItem records"""
+    media_df = pd.DataFrame(media_items).rename(columns=_MEDIA_COLUMNS)
+    media_df["date"] = media_df["upload_date"].dt.strftime("%Y-%m-%d")
+    return media_df
+
+@st.cache_data(show_spinner=False)
+def _sample_media_frame():
+    """Build the sample media DataFrame once; it holds no session data"""
+    return _media_frame(get_sample_media())
+
+def _uploaded_media_item(uploaded):
+    """Convert an uploaded media entry into a MediaItem"""
+    return MediaItem(
+        file_name=uploaded['name'],
+        file_path=uploaded.get('file_path', ''),
+        file_type=uploaded['type'],
+        booth=uploaded.get('location', 'Unknown'),
+        upload_date=datetime.strptime(uploaded['date'], "%Y-%m-%d"),
+        uploader_name=uploaded.get('photographer', 'Unknown'),
+        size_label=uploaded['size'],
+        tags=uploaded.get('tags', []),
+        source="uploaded",
+        description=uploaded.get('description', ''),
+        category=uploaded.get('category', 'General')
+    )
 
 def get_combined_media():
-    """Combine sample media with uploaded media"""
+    """Combine sample media with uploaded media into a DataFrame"""
     # Initialize session state for uploaded media
     if 'uploaded_media' not in st.session_state:
         st.session_state.uploaded_media = []
     
-    sample_media = get_sample_media()
-    all_media = sample_media.copy()
+    uploaded_media = st.session_state.uploaded_media
+    if not uploaded_media:
+        return _sample_media_frame()
     
-    # Add uploaded media from session state
-    if st.session_state.uploaded_media:
-        for uploaded in st.session_state.uploaded_media:
-            media_item = {
-                "name": uploaded['name'],
-                "type": uploaded['type'],
-                "booth": uploaded.get('location', 'Unknown'),
-                "date": uploaded['date'],
-                "photographer": uploaded.get('photographer', 'Unknown'),
-                "size": uploaded['size'],
-                "downloads": 0,
-                "likes": 0,
-                "tags": uploaded.get('tags', []),
-                "source": "uploaded",
-                "description": uploaded.get('description', ''),
-                "category": uploaded.get('category', 'General')
-            }
-            all_media.append(media_item)
-    
-    return all_media
-
-def apply_media_filters(media_list, filter_booth, filter_type):
-    """Apply filters to media list"""
-    filtered_media = media_list
-    if filter_booth != "All":
-        filtered_media = [m for m in filtered_media if m['booth'] == filter_booth]
-    if filter_type != "All":
-        filtered_media = [m for m in filtered_media if m['type'] == filter_type]
-    return filtered_media
-
-def show_gallery_overview(all_media):
+    # Uploads are session data, so memoize the frame in this session only;
+    # entries are only ever appended, so the count identifies the frame
+    cached = st.session_state.get('_media_frame_cache')
+    if cached is not None and cached[0] == len(uploaded_media):
+        return cached[1]
+    
+    media_df = pd.concat(
+        [_sample_media_frame(), _media_frame([_uploaded_media_item(u) for u in uploaded_media])],
+        ignore_index=True
+    )
+    st.session_state._media_frame_cache = (len(uploaded_media), media_df)
+    return media_df
+
+def apply_media_filters(media_df, filter_booth, filter_type):
+    """Apply filters with vectorized masks and count media by type"""
+    mask = (media_df['booth'] == filter_booth) | (filter_booth == "All")
+    mask &= (media_df['type'] == filter_type) | (filter_type == "All")
+    
+    type_counts = media_df['type'].value_counts()
+    counts = {
+        "total": len(media_df),
+        "Photo": int(type_counts.get("Photo", 0)),
+        "Video": int(type_counts.get("Video", 0)),
+        "uploaded": int((media_df['source'] == 'uploaded').sum())
+    }
+    
+    return media_df[mask].to_dict('records'), counts
+
+def show_gallery_overview(counts):
     """Display gallery overview metrics"""
     st.markdown("#### 📊 Gallery Overview")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("📸 Total Media", len(all_media))
+        st.metric("📸 Total Media", counts["total"])
     with col2:
-        photos = len([m for m in all_media if m['type'] == 'Photo'])
-        st.metric("📷 Photos", photos)
+        st.metric("📷 Photos", counts["Photo"])
     with col3:
-        videos = len([m for m in all_media if m['type'] == 'Video'])
-        st.metric("🎥 Videos", videos)
+        st.metric("🎥 Videos", counts["Video"])
     with col4:
-        uploaded = len([m for m in all_media if m.get('source') == 'uploaded'])
-        st.metric("📤 Uploaded", uploaded)
+        st.metric("📤 Uploaded", counts["uploaded"])
 
 def show_media_grid(filtered_media):
     """Display media in grid format"""
     st.markdown("#### 🖼️ Media Gallery")
-    for i in range(0, len(filtered_media), 2):
-        col1, col2 = st.columns(2)
-        
-        for j, col in enumerate([col1, col2]):
-            if i + j < len(filtered_media):
-                media = filtered_media[i + j]
-                with col:
-                    display_media_card(media, i + j)
-
-def display_media_card(media, index):
-    """Display individual media card"""
-    with st.container():
-        # Different styling for uploaded vs sample media
-        border_color = "#4CAF50" if media.get('source') == 'uploaded' else "#ddd"
-        source_badge = "🆕 NEW" if media.get('source') == 'uploaded' else "📋 SAMPLE"
-        
-        st.markdown(f"""
-        <div style="border: 2px solid {border_color}; border-radius: 8px; padding: 15px; margin: 10px 0; background: white;">
-            <h4>📸 {media['name']} <span style="background: {border_color}; color: white; padding: 2px 6px; border-radius: 3px; font-size: 10px;">{source_badge}</span></h4>
-            <p><strong>Type:</strong> {media['type']} | <strong>Size:</strong> {media['size']}</p>
-            <p><strong>Location:</strong> {media['booth']}</p>
-            <p><strong>Date:</strong> {media['date']}</p>
-            <p><strong>Photographer:</strong> {media['photographer']}</p>
-            <p><strong>Tags:</strong> {', '.join(media['tags']) if isinstance(media['tags'], list) else media['tags']}</p>
-            <p>👁️ {media['downloads']} downloads | ❤️ {media['likes']} likes</p>
-            {f"<p><strong>Description:</strong> {media.get('description', '')}</p>" if media.get('description') else ""}
-        </div>
-        """, unsafe_allow_html=True)
-        
-        show_media_actions(media, index)
+    if not filtered_media:
+        st.info("No media matches these filters.")
+        return
+    
+    # Render the whole gallery as one markdown block
+    cards_html = "".join([build_media_card_html(media) for media in filtered_media])
+    st.markdown(_GRID_TMPL.format(cards=cards_html), unsafe_allow_html=True)
+    
+    show_media_actions(filtered_media)
 
-def show_media_actions(media, index):
-    """Display media action buttons"""
-    col_a, col_b, col_c = st.columns(3)
-    with col_a:
-        if st.button(f"👁️ View", key=f"view_{index}"):
-            if media.get('source') == 'uploaded':
-                st.success(f"Viewing uploaded file: {media['name']}")
+def build_media_card_html(media):
+    """Build the HTML for an individual media card"""
+    # Different styling for uploaded vs sample media
+    card_tmpl = _CARD_TMPLS.get(media.get('source'), _CARD_TMPLS["sample"])
+    
+    # Uploaded names, locations, credits, tags and descriptions are user input
+    tags = media['tags']
+    description = media.get('description')
+    return card_tmpl.format_map({
+        **media,
+        "name": html.escape(str(media['name'])),
+        "booth": html.escape(str(media['booth'])),
+        "photographer": html.escape(str(media['photographer'])),
+        "tags_str": html.escape(', '.join(tags) if isinstance(tags, list) else str(tags)),
+        "desc_block": _CARD_DESC_TMPL.format(description=html.escape(description)) if description else ""
+    })
+
+def show_media_actions(filtered_media):
+    """Display a single action form for the selected media item"""
+    with st.form("media_actions"):
+        col_a, col_b, col_c = st.columns([3, 2, 1])
+        with col_a:
+            index = st.selectbox(
+                "Select media:",
+                range(len(filtered_media)),
+                format_func=lambda i: filtered_media[i]['name']
+            )
+        with col_b:
+            action = st.radio("Action:", ["👁️ View", "📥 Download", "❤️ Like"], horizontal=True)
+        with col_c:
+            submitted = st.form_submit_button("Go", use_container_width=True)
+        
+        if submitted:
+            media = filtered_media[index]
+            if action == "👁️ View":
+                if media.get('source') == 'uploaded':
+                    st.success(f"Viewing uploaded file: {media['name']}")
+                else:
+                    st.success(f"Viewing {media['name']}")
+            elif action == "📥 Download":
+                st.success(f"Downloading {media['name']}")
+                # Increment download count
+                media['downloads'] += 1
+                if media.get('source') == 'uploaded':
+                    show_media_download_link(media)
             else:
-                st.success(f"Viewing {media['name']}")
-    with col_b:
-        if st.button(f"📥 Download", key=f"download_{index}"):
-            st.success(f"Downloading {media['name']}")
-            # Increment download count
-            media['downloads'] += 1
-    with col_c:
-        if st.button(f"❤️ Like", key=f"like_{index}"):
-            st.success(f"Liked {media['name']}")
-            # Increment like count
-            media['likes'] += 1
+                st.success(f"Liked {media['name']}")
+                # Increment like count
+                media['likes'] += 1
+
+def get_media_b64(media):
+    """Base64-encode a saved media file on demand"""
+    file_path = media.get('file_path')
+    return get_base64_encoded_path(file_path) if file_path else None
+
+def show_media_download_link(media):
+    """Show a download link for an uploaded media item"""
+    file_path = media.get('file_path')
+    uploaded = next(
+        (u for u in st.session_state.uploaded_media if file_path and u.get('file_path') == file_path),
+        None
+    )
+    if not uploaded or not uploaded.get('downloads_allowed'):
+        st.info("Downloads are disabled for this file.")
+        return
+    
+    encoded = get_media_b64(uploaded)
+    if encoded:
+        st.markdown(
+            f'<a href="data:application/octet-stream;base64,{encoded}" download="{html.escape(media["name"])}">💾 Save file</a>',
+            unsafe_allow_html=True
+        )
 
 def show_upload_interface():
     """Show file upload interface"""
@@ -309,8 +404,8 @@ def display_uploaded_files_preview(uploaded_files):
                 # File-specific metadata
                 if file_info['type'].startswith('image/'):
                     try:
-                        image = Image.open(file)
-                        st.write(f"**Dimensions:** {image.size[0]} x {image.size[1]} pixels")
+                        width, height = get_image_size(file)
+                        st.write(f"**Dimensions:** {width} x {height} pixels")
                     except Exception:
                         pass
                 elif file_info['type'].startswith('video/'):
@@ -338,15 +433,18 @@ def load_sample_images():
         {"name": "registration_desk.jpg", "type": "image/jpeg", "size": 1.8},
         {"name": "main_stage.jpg", "type": "image/jpeg", "size": 3.2}
     ]
-    for img in sample_images:
-        st.session_state.uploaded_media.append({
+    today = datetime.now().strftime("%Y-%m-%d")
+    st.session_state.uploaded_media.extend(
+        {
             "name": img["name"],
             "type": "Photo",
             "size": f"{img['size']} MB",
             "location": "Sample Location",
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today,
             "status": "Uploaded"
-        })
+        }
+        for img in sample_images
+    )
     st.success("✅ Sample images loaded!")
 
 def load_sample_videos():
@@ -355,15 +453,18 @@ def load_sample_videos():
         {"name": "opening_ceremony.mp4", "type": "video/mp4", "size": 45.2},
         {"name": "workshop_session.mp4", "type": "video/mp4", "size": 38.5}
     ]
-    for vid in sample_videos:
-        st.session_state.uploaded_media.append({
+    today = datetime.now().strftime("%Y-%m-%d")
+    st.session_state.uploaded_media.extend(
+        {
             "name": vid["name"],
             "type": "Video",
             "size": f"{vid['size']} MB",
             "location": "Sample Location",
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today,
             "status": "Uploaded"
-        })
+        }
+        for vid in sample_videos
+    )
     st.success("✅ Sample videos loaded!")
 
 def show_upload_metadata_form():
@@ -403,7 +504,10 @@ def show_save_media_button(booth_location, event_category, photographer, descrip
 
 def process_uploaded_files(uploaded_files, booth_location, event_category, photographer, description, tags, make_public, allow_downloads, require_attribution):
     """Process and save uploaded files"""
-    for file in uploaded_files:
+    tag_list = [tag.strip() for tag in tags.split(',')] if tags else []
+    saved_files = save_uploaded_files(uploaded_files, "media/uploads")
+    
+    for file, saved in zip(uploaded_files, saved_files):
         file_info = get_file_info(file)
         
         # Save file information to session state
@@ -415,13 +519,13 @@ def process_uploaded_files(uploaded_files, booth_location, event_category, photo
             "category": event_category,
             "photographer": photographer,
             "description": description,
-            "tags": tags.split(',') if tags else [],
+            "tags": list(tag_list),
             "date": datetime.now().strftime("%Y-%m-%d"),
             "status": "Uploaded",
             "public": make_public,
             "downloads_allowed": allow_downloads,
             "attribution_required": require_attribution,
-            "file_data": get_base64_encoded_file(file)  # Store file data
+            "file_path": saved["path"]  # Bytes stay on disk; base64-encoded only on download
         }
         
         st.session_state.uploaded_media.append(media_entry)
@@ -456,49 +560,51 @@ def show_media_metrics():
     with col4:
         st.metric("💾 Storage Used", "2.3 GB")
 
+@st.cache_resource(show_spinner=False)
+def _media_type_pie():
+    """Build the media type distribution chart once per process"""
+    media_types = {"Photos": 18, "Videos": 4, "Documents": 2}
+    return px.pie(values=list(media_types.values()), names=list(media_types.keys()),
+                  title="Media Type Distribution")
+
+@st.cache_resource(show_spinner=False)
+def _daily_upload_bar():
+    """Build the daily upload activity chart once per process"""
+    dates = ["2025-01-28", "2025-01-29", "2025-01-30", "2025-01-31"]
+    uploads = [3, 8, 10, 3]
+    return px.bar(x=dates, y=uploads, title="Daily Upload Activity")
+
 def show_media_charts():
     """Display media analytics charts"""
     col1, col2 = st.columns(2)
     with col1:
         # Media type distribution
-        media_types = {"Photos": 18, "Videos": 4, "Documents": 2}
-        fig = px.pie(values=list(media_types.values()), names=list(media_types.keys()),
-                    title="Media Type Distribution")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_media_type_pie(), use_container_width=True)
     
     with col2:
         # Upload activity over time
-        dates = ["2025-01-28", "2025-01-29", "2025-01-30", "2025-01-31"]
-        uploads = [3, 8, 10, 3]
-        fig = px.bar(x=dates, y=uploads, title="Daily Upload Activity")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_daily_upload_bar(), use_container_width=True)
 
 def show_top_contributors():
     """Display top contributors table"""
     st.markdown("#### 🏆 Top Contributors")
-    contributors = [
-        {"Name": "Sarah Johnson", "Uploads": 8, "Downloads": 45, "Likes": 32},
-        {"Name": "Mike Wilson", "Uploads": 6, "Downloads": 38, "Likes": 28},
-        {"Name": "Alice Brown", "Uploads": 4, "Downloads": 22, "Likes": 15},
-        {"Name": "John Smith", "Uploads": 3, "Downloads": 28, "Likes": 18},
-        {"Name": "David Lee", "Uploads": 2, "Downloads": 15, "Likes": 12},
-    ]
-    
-    contrib_df = pd.DataFrame(contributors)
-    st.dataframe(contrib_df, use_container_width=True, hide_index=True)
+    st.dataframe(_CONTRIB_DF, use_container_width=True, hide_index=True)
 
-def show_storage_breakdown():
-    """Display storage usage breakdown"""
-    st.markdown("#### 💾 Storage Breakdown")
+@st.cache_resource(show_spinner=False)
+def _storage_bar():
+    """Build the storage usage chart once per process"""
     storage_data = {
         "Photos": 1.8,
         "Videos": 0.4,
         "Documents": 0.1
     }
-    
-    fig = px.bar(x=list(storage_data.keys()), y=list(storage_data.values()),
-                title="Storage Usage by Type (GB)")
-    st.plotly_chart(fig, use_container_width=True)
+    return px.bar(x=list(storage_data.keys()), y=list(storage_data.values()),
+                  title="Storage Usage by Type (GB)")
+
+def show_storage_breakdown():
+    """Display storage usage breakdown"""
+    st.markdown("#### 💾 Storage Breakdown")
+    st.plotly_chart(_storage_bar(), use_container_width=True)
 
 def show_active_streams():
     """Display active streams"""
@@ -560,14 +666,21 @@ def show_chat_moderation():
         {"User": "organizer_mike", "Message": "Next session starts in 10 minutes", "Time": "14:33"},
     ]
     
-    for msg in chat_messages:
-        col1, col2, col3, col4 = st.columns([2, 4, 1, 1])
-        with col1:
-            st.write(f"**{msg['User']}**")
-        with col2:
-            st.write(msg['Message'])
-        with col3:
-            st.write(msg['Time'])
-        with col4:
-            if st.button("🗑️", key=f"delete_{msg['Time']}"):
-                st.success("Message deleted")
+    # Render the chat log as one HTML table; message text is escaped since it is user content
+    rows_html = "\n".join(
+        f"<tr><td><strong>{html.escape(msg['User'])}</strong></td><td>{html.escape(msg['Message'])}</td><td>{msg['Time']}</td></tr>"
+        for msg in chat_messages
+    )
+    st.markdown(f'<table style="width: 100%;">\n{rows_html}\n</table>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        selected = st.selectbox(
+            "Select message:",
+            range(len(chat_messages)),
+            format_func=lambda i: f"{chat_messages[i]['Time']} - {chat_messages[i]['User']}",
+            key="chat_message_target"
+        )
+    with col2:
+        if st.button("🗑️ Delete", key="delete_chat_message", use_container_width=True):
+            st.success(f"Message from {chat_messages[selected]['User']} deleted")
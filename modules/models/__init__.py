@@ -3,12 +3,16 @@ Data Models for EventIQ Management System
 Type-safe data structures for all modules
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from modules.constants import UserRole, VolunteerStatus, BoothStatus, WorkflowStatus, FeedbackType
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ (slots= requires Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class User:
     """User model"""
     id: Optional[str] = None
@@ -21,7 +25,7 @@ class User:
     is_active: bool = True
     profile_image: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Event:
     """Event model"""
     id: Optional[str] = None
@@ -35,7 +39,7 @@ class Event:
     organizer_id: Optional[str] = None
     is_active: bool = True
 
-@dataclass
+@dataclass(**_SLOTS)
 class Volunteer:
     """Volunteer model"""
     id: Optional[str] = None
@@ -45,7 +49,7 @@ class Volunteer:
     phone: str = ""
     role: str = ""
     skills: str = ""
-    availability: List[str] = None
+    availability: List[str] = field(default_factory=list)
     emergency_contact: str = ""
     t_shirt_size: str = ""
     dietary_restrictions: str = ""
@@ -54,12 +58,8 @@ class Volunteer:
     rating: float = 0.0
     resume_path: Optional[str] = None
     id_document_path: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.availability is None:
-            self.availability = []
 
-@dataclass
+@dataclass(**_SLOTS)
 class Participant:
     """Participant model"""
     id: Optional[str] = None
@@ -76,7 +76,7 @@ class Participant:
     payment_status: str = "pending"
     profile_image: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Vendor:
     """Vendor model"""
     id: Optional[str] = None
@@ -91,13 +91,9 @@ class Vendor:
     booth_id: Optional[str] = None
     contract_value: float = 0.0
     payment_status: str = "pending"
-    documents: List[str] = None
-    
-    def __post_init__(self):
-        if self.documents is None:
-            self.documents = []
+    documents: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_SLOTS)
 class Booth:
     """Booth model"""
     id: str = ""
@@ -108,14 +104,10 @@ class Booth:
     price: float = 0.0
     has_power: bool = False
     has_wifi: bool = False
-    special_features: List[str] = None
+    special_features: List[str] = field(default_factory=list)
     layout_plan: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.special_features is None:
-            self.special_features = []
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Certificate:
     """Certificate model"""
     id: Optional[str] = None
@@ -128,7 +120,7 @@ class Certificate:
     template_used: str = ""
     is_downloaded: bool = False
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowStep:
     """Workflow step model"""
     step_number: int = 0
@@ -139,7 +131,7 @@ class WorkflowStep:
     is_completed: bool = False
     completed_date: Optional[datetime] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Workflow:
     """Workflow model"""
     id: Optional[str] = None
@@ -152,16 +144,10 @@ class Workflow:
     created_date: Optional[datetime] = None
     due_date: Optional[datetime] = None
     progress_percentage: int = 0
-    steps: List[WorkflowStep] = None
-    attachments: List[str] = None
-    
-    def __post_init__(self):
-        if self.steps is None:
-            self.steps = []
-        if self.attachments is None:
-            self.attachments = []
+    steps: List[WorkflowStep] = field(default_factory=list)
+    attachments: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_SLOTS)
 class Feedback:
     """Feedback model"""
     id: Optional[str] = None
@@ -180,13 +166,9 @@ class Feedback:
     would_attend_again: str = ""
     submit_date: Optional[datetime] = None
     is_anonymous: bool = False
-    attachments: List[str] = None
-    
-    def __post_init__(self):
-        if self.attachments is None:
-            self.attachments = []
+    attachments: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_SLOTS)
 class BudgetItem:
     """Budget item model"""
     id: Optional[str] = None
@@ -200,7 +182,7 @@ class BudgetItem:
     receipt_path: Optional[str] = None
     status: str = "planned"
 
-@dataclass
+@dataclass(**_SLOTS)
 class MediaItem:
     """Media item model"""
     id: Optional[str] = None
@@ -211,27 +193,25 @@ class MediaItem:
     upload_date: Optional[datetime] = None
     uploader_name: str = ""
     description: str = ""
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     is_featured: bool = False
-    
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+    booth: str = ""
+    category: str = ""
+    size_label: str = ""
+    downloads: int = 0
+    likes: int = 0
+    source: str = "uploaded"
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalyticsData:
     """Analytics data model"""
     metric_name: str = ""
     metric_value: Any = None
     metric_type: str = "counter"  # counter, gauge, histogram
     timestamp: Optional[datetime] = None
-    dimensions: Dict[str, str] = None
-    
-    def __post_init__(self):
-        if self.dimensions is None:
-            self.dimensions = {}
+    dimensions: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileUpload:
     """File upload model"""
     file_name: str = ""
@@ -4,6 +4,19 @@ Team Member: [Participants Management Team]
 """
 
 from .utils import *
+import plotly.express as px
+
+# Rows per chunk when importing participant CSVs, keeping memory flat for large files
+_IMPORT_CHUNK_ROWS = 50_000
+
+# Explicit column types so st.dataframe skips per-column auto-detection
+_PARTICIPANT_COLUMNS = {
+    "Name": st.column_config.TextColumn("Name"),
+    "Email": st.column_config.TextColumn("Email"),
+    "Organization": st.column_config.TextColumn("Organization"),
+    "Industry": st.column_config.TextColumn("Industry"),
+    "Status": st.column_config.TextColumn("Status"),
+}
 
 def show_participants_module():
     """Participants management interface"""
@@ -37,18 +50,19 @@ def show_participants_list():
         status_filter = st.selectbox("Filter by Status:", ["All", "Registered", "Checked-in", "Cancelled"])
     
     # Sample participant data
-    participants_data = get_sample_participants_data()
-    df = pd.DataFrame(participants_data)
+    df = _participants_df()
     
-    # Apply filters
+    # Apply filters as a single combined mask
+    mask = pd.Series(True, index=df.index)
     if search_term:
-        df = df[df['Name'].str.contains(search_term, case=False)]
+        mask &= _participant_names_lower().str.contains(search_term.lower(), regex=False, na=False)
     if organization_filter != "All":
-        df = df[df['Organization'] == organization_filter]
+        mask &= df['Organization'] == organization_filter
     if status_filter != "All":
-        df = df[df['Status'] == status_filter]
+        mask &= df['Status'] == status_filter
+    df = df[mask]
     
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.dataframe(df, use_container_width=True, hide_index=True, column_config=_PARTICIPANT_COLUMNS)
 
 def show_add_participant():
     """Add individual participant interface"""
@@ -106,17 +120,31 @@ def show_bulk_import():
             # Process and preview CSV
             if csv_file.type == 'text/csv':
                 try:
-                    df = pd.read_csv(csv_file)
+                    preview_df, row_count = preview_csv_upload(csv_file)
                     st.markdown("##### 📋 Data Preview:")
-                    st.dataframe(df.head(), use_container_width=True)
-                    st.info(f"Found {len(df)} participants in the file")
+                    st.dataframe(preview_df, use_container_width=True)
+                    st.info(f"Found {row_count} participants in the file")
                     
                     if st.button("📥 Import All Participants", use_container_width=True):
-                        st.success(f"✅ Successfully imported {len(df)} participants!")
+                        imported = import_participants_csv(csv_file, row_count)
+                        st.success(f"✅ Successfully imported {imported} participants!")
                         show_success_animation()
                 except Exception as e:
                     st.error(f"Error processing CSV: {str(e)}")
 
+def import_participants_csv(csv_file, expected_rows):
+    """Import participants chunk by chunk with a progress bar and return the row count"""
+    progress = st.progress(0.0)
+    imported = 0
+    
+    # Read as strings to skip type inference; each chunk is where a batch insert would go
+    csv_file.seek(0)
+    for chunk in pd.read_csv(csv_file, chunksize=_IMPORT_CHUNK_ROWS, dtype=str):
+        imported += len(chunk)
+        progress.progress(min(1.0, imported / max(expected_rows, 1)))
+    
+    return imported
+
 def show_participants_analytics():
     """Display participants analytics"""
     st.markdown("### 📊 Participant Analytics")
@@ -136,18 +164,31 @@ def show_participants_analytics():
     col1, col2 = st.columns(2)
     with col1:
         # Industry distribution
-        industry_data = {"Technology": 45, "Healthcare": 25, "Finance": 20, "Education": 15, "Other": 20}
-        fig = px.pie(values=list(industry_data.values()), names=list(industry_data.keys()),
-                    title="Participants by Industry")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_industry_pie(), use_container_width=True)
     
     with col2:
         # Registration over time
-        dates = ["2025-01-28", "2025-01-29", "2025-01-30", "2025-01-31"]
-        registrations = [15, 25, 35, 50]
-        fig = px.line(x=dates, y=registrations, title="Registration Growth")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_registration_line(), use_container_width=True)
+
+@st.cache_resource(show_spinner=False)
+def _industry_pie():
+    """Build the industry distribution chart once per process"""
+    industry_data = {"Technology": 45, "Healthcare": 25, "Finance": 20, "Education": 15, "Other": 20}
+    fig = px.pie(values=list(industry_data.values()), names=list(industry_data.keys()),
+                title="Participants by Industry")
+    fig.update_layout(uirevision="static")
+    return fig
 
+@st.cache_resource(show_spinner=False)
+def _registration_line():
+    """Build the registration growth chart once per process"""
+    dates = ["2025-01-28", "2025-01-29", "2025-01-30", "2025-01-31"]
+    registrations = [15, 25, 35, 50]
+    fig = px.line(x=dates, y=registrations, title="Registration Growth")
+    fig.update_layout(uirevision="static")
+    return fig
+
+@st.cache_data(show_spinner=False)
 def get_sample_participants_data():
     """Get sample participants data"""
     return [
@@ -158,6 +199,17 @@ def get_sample_participants_data():
         {"Name": "David Brown", "Email": "david@finance.com", "Organization": "Finance Pro", "Industry": "Finance", "Status": "Registered"},
     ]
 
+@st.cache_data(show_spinner=False)
+def _participants_df():
+    """Build the participants DataFrame once and reuse it across reruns"""
+    return pd.DataFrame(get_sample_participants_data()).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_data(show_spinner=False)
+def _participant_names_lower():
+    """Case-fold participant names once so searches skip per-call lowercasing"""
+    return _participants_df()['Name'].str.lower()
+
+@st.cache_data(show_spinner=False)
 def get_participants_csv_template():
     """Get CSV template for participants import"""
     return """name,email,phone,organization,industry,role,dietary_restrictions
@@ -4,20 +4,47 @@ Centralized file handling and validation
 """
 
 import os
-import uuid
+import shutil
+import time
+import itertools
+import functools
 import mimetypes
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, FrozenSet
 from modules.config import config
 from modules.constants import *
 from modules.models import FileUpload
 
+# Allowed extensions per upload category, frozen once at import
+_EXTENSION_MAP = {
+    "image": frozenset(IMAGE_EXTENSIONS),
+    "document": frozenset(DOCUMENT_EXTENSIONS),
+    "spreadsheet": frozenset(SPREADSHEET_EXTENSIONS),
+    "presentation": frozenset(PRESENTATION_EXTENSIONS),
+    "archive": frozenset(ARCHIVE_EXTENSIONS),
+    "cad": frozenset(CAD_EXTENSIONS),
+    "video": frozenset(VIDEO_EXTENSIONS),
+    "audio": frozenset(AUDIO_EXTENSIONS)
+}
+_DEFAULT_EXTENSIONS = _EXTENSION_MAP["document"]
+_TMP_SUFFIX = ".tmp"
+
+@functools.lru_cache(maxsize=128)
+def _upload_dir(base_dir: str, module: str, category: str) -> str:
+    """Join an upload directory path once per (base, module, category)"""
+    return os.path.join(base_dir, module, category)
+
 class FileService:
     """Service for handling file operations"""
     
+    CHUNK_SIZE = 64 * 1024
+    _SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+    
     def __init__(self):
         self.upload_base_dir = config.get("file_upload.upload_directory", "uploads")
         self.max_file_size = config.get("file_upload.max_file_size_mb", 10) * 1024 * 1024
+        self._pid_hex = f"{os.getpid():x}"
+        self._sequence = itertools.count()
         
     def validate_file(self, file, category: str = "document") -> Dict[str, Any]:
         """
@@ -35,23 +62,24 @@ class FileService:
             validation_result["errors"].append("No file provided")
             return validation_result
         
-        # Check file size
-        if hasattr(file, 'size') and file.size > self.max_file_size:
-            validation_result["is_valid"] = False
-            validation_result["errors"].append(f"File size ({file.size} bytes) exceeds maximum allowed size ({self.max_file_size} bytes)")
-        
-        # Check file type
+        # Check file type first: a pure string check that needs no file metadata
         file_extension = file.name.split('.')[-1].lower() if '.' in file.name else ""
-        allowed_extensions = self._get_allowed_extensions(category)
-        
-        if file_extension not in allowed_extensions:
+        if file_extension not in self._get_allowed_extensions(category):
             validation_result["is_valid"] = False
             validation_result["errors"].append(f"File type '{file_extension}' not allowed for category '{category}'")
+            return validation_result
+        
+        # Check file size
+        file_size = getattr(file, 'size', 0)
+        if file_size > self.max_file_size:
+            validation_result["is_valid"] = False
+            validation_result["errors"].append(f"File size ({file_size} bytes) exceeds maximum allowed size ({self.max_file_size} bytes)")
+            return validation_result
         
         # Get file info
         validation_result["file_info"] = {
             "name": file.name,
-            "size": getattr(file, 'size', 0),
+            "size": file_size,
             "type": file.type if hasattr(file, 'type') else mimetypes.guess_type(file.name)[0],
             "extension": file_extension
         }
@@ -75,8 +103,9 @@ class FileService:
         
         # Generate unique filename
         file_extension = validation["file_info"]["extension"]
-        unique_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Nanosecond clock plus pid and a per-process counter: unique without uuid4 or strftime
+        timestamp = f"{time.time_ns():016x}"
+        unique_id = f"{self._pid_hex}{next(self._sequence):x}"
         
         if custom_name:
             safe_name = self._sanitize_filename(custom_name)
@@ -86,18 +115,29 @@ class FileService:
             filename = f"{timestamp}_{safe_name}_{unique_id}.{file_extension}"
         
         # Create directory structure
-        save_dir = os.path.join(self.upload_base_dir, module, category)
+        save_dir = _upload_dir(self.upload_base_dir, module, category)
+        # Created on every save: the directory may have been removed since the last one
         os.makedirs(save_dir, exist_ok=True)
         
-        # Save file
+        # Save file to a temporary path and rename it into place so readers never see a partial file
         file_path = os.path.join(save_dir, filename)
+        tmp_path = f"{file_path}.{os.getpid()}{_TMP_SUFFIX}"
         
         try:
-            with open(file_path, "wb") as f:
-                if hasattr(file, 'read'):
-                    f.write(file.read())
+            with open(tmp_path, "wb") as f:
+                if hasattr(file, 'getbuffer'):
+                    # In-memory uploads are written straight from a zero-copy view of their buffer
+                    f.write(file.getbuffer())
+                elif hasattr(file, 'read'):
+                    # Stream in fixed-size chunks so large uploads are never held in memory twice
+                    if hasattr(file, 'seek'):
+                        file.seek(0)
+                    shutil.copyfileobj(file, f, self.CHUNK_SIZE)
                 else:
                     f.write(file.getvalue())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             
             return FileUpload(
                 file_name=filename,
@@ -111,6 +151,10 @@ class FileService:
             )
             
         except Exception as e:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             return FileUpload(
                 file_name=file.name,
                 is_valid=False,
@@ -122,16 +166,7 @@ class FileService:
         if not os.path.exists(file_path):
             return {"exists": False, "error": "File not found"}
         
-        file_stats = os.stat(file_path)
-        return {
-            "exists": True,
-            "name": os.path.basename(file_path),
-            "size": file_stats.st_size,
-            "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
-            "created": datetime.fromtimestamp(file_stats.st_ctime),
-            "modified": datetime.fromtimestamp(file_stats.st_mtime),
-            "extension": os.path.splitext(file_path)[1][1:].lower()
-        }
+        return self._stat_info(os.path.basename(file_path), os.stat(file_path))
     
     def delete_file(self, file_path: str) -> bool:
         """Delete a file safely"""
@@ -149,11 +184,11 @@ class FileService:
         files = []
         
         if os.path.exists(directory):
-            for filename in os.listdir(directory):
-                file_path = os.path.join(directory, filename)
-                if os.path.isfile(file_path):
-                    file_info = self.get_file_info(file_path)
-                    files.append(file_info)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Skip in-progress writes from save_file; they are renamed into place when complete
+                    if entry.is_file() and not entry.name.endswith(_TMP_SUFFIX):
+                        files.append(self._stat_info(entry.name, entry.stat()))
         
         return files
     
@@ -162,36 +197,47 @@ class FileService:
         cleaned_count = 0
         cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
         
-        for root, dirs, files in os.walk(self.upload_base_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if os.path.getmtime(file_path) < cutoff_time:
-                    if self.delete_file(file_path):
-                        cleaned_count += 1
+        for entry in self._iter_files(self.upload_base_dir):
+            if entry.stat().st_mtime < cutoff_time:
+                try:
+                    os.remove(entry.path)
+                    cleaned_count += 1
+                except OSError:
+                    pass
         
         return cleaned_count
     
-    def _get_allowed_extensions(self, category: str) -> List[str]:
-        """Get allowed file extensions for category"""
-        extension_map = {
-            "image": IMAGE_EXTENSIONS,
-            "document": DOCUMENT_EXTENSIONS,
-            "spreadsheet": SPREADSHEET_EXTENSIONS,
-            "presentation": PRESENTATION_EXTENSIONS,
-            "archive": ARCHIVE_EXTENSIONS,
-            "cad": CAD_EXTENSIONS,
-            "video": VIDEO_EXTENSIONS,
-            "audio": AUDIO_EXTENSIONS
+    def _iter_files(self, directory: str):
+        """Recursively yield file entries, reusing the stat data cached by scandir"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._iter_files(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            return
+    
+    def _stat_info(self, name: str, file_stats: os.stat_result) -> Dict[str, Any]:
+        """Build file info from an already fetched stat result"""
+        return {
+            "exists": True,
+            "name": name,
+            "size": file_stats.st_size,
+            "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
+            "created": datetime.fromtimestamp(file_stats.st_ctime),
+            "modified": datetime.fromtimestamp(file_stats.st_mtime),
+            "extension": os.path.splitext(name)[1][1:].lower()
         }
-        
-        return extension_map.get(category, DOCUMENT_EXTENSIONS)
+    
+    def _get_allowed_extensions(self, category: str) -> FrozenSet[str]:
+        """Get allowed file extensions for category"""
+        return _EXTENSION_MAP.get(category, _DEFAULT_EXTENSIONS)
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to remove invalid characters"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename[:50]  # Limit length
+        return filename.translate(self._SANITIZE_TABLE)[:50]  # Limit length
 
 # Global file service instance
 file_service = FileService()
@@ -5,6 +5,11 @@ Team Member: [Settings & Configuration Team]
 
 from .utils import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def show_settings_page():
     """System settings page"""
     st.markdown("## ⚙️ System Settings")
@@ -82,15 +87,16 @@ def show_config_upload():
         file_info = get_file_info(config_file)
         st.success(f"✅ Config uploaded: {config_file.name} ({file_info['size_mb']:.2f} MB)")
         
-        # Show file preview
+        # Show file preview from a single read of the upload
+        raw = config_file.getvalue()
         if config_file.type == "application/json":
             try:
-                config_content = json.loads(config_file.getvalue().decode('utf-8'))
+                config_content = orjson.loads(raw) if orjson else json.loads(raw)
                 st.json(config_content)
-            except:
+            except ValueError:
                 st.warning("Invalid JSON format")
         else:
-            content_preview = config_file.getvalue().decode('utf-8')[:500]
+            content_preview = raw[:500].decode('utf-8', errors='replace')
             st.text_area("File Preview:", content_preview, height=100, disabled=True)
         
         if st.button("📥 Apply Configuration", use_container_width=True):
@@ -153,9 +159,7 @@ def show_user_management():
 def show_active_users():
     """Display active users list"""
     st.markdown("#### 👤 Active Users")
-    users_data = get_users_data()
-    users_df = pd.DataFrame(users_data)
-    st.dataframe(users_df, use_container_width=True, hide_index=True)
+    st.dataframe(_users_df(), use_container_width=True, hide_index=True)
 
 def show_user_actions():
     """User management action buttons"""
@@ -165,12 +169,9 @@ def show_user_actions():
             st.success("New user creation form would open")
     with col2:
         if st.button("📤 Export Users", use_container_width=True):
-            # Generate CSV export
-            users_df = pd.DataFrame(get_users_data())
-            csv_data = users_df.to_csv(index=False)
             st.download_button(
                 "📥 Download CSV",
-                csv_data,
+                _users_csv(),
                 "users_export.csv",
                 "text/csv"
             )
@@ -196,14 +197,15 @@ def show_bulk_user_import():
             
             try:
                 if user_import_file.name.endswith('.csv'):
-                    df = pd.read_csv(user_import_file)
+                    preview_df, row_count = preview_csv_upload(user_import_file)
                 else:
                     df = pd.read_excel(user_import_file)
+                    preview_df, row_count = df.head(), len(df)
                 
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(preview_df, use_container_width=True)
                 
                 if st.button("👥 Import Users", use_container_width=True):
-                    st.success(f"✅ {len(df)} users imported successfully!")
+                    st.success(f"✅ {row_count} users imported successfully!")
                     show_success_animation()
             
             except Exception as e:
@@ -323,6 +325,7 @@ def show_notification_templates():
         st.success(f"✅ {template_type} template saved!")
 
 # Helper functions for settings module
+@st.cache_data(show_spinner=False)
 def get_sample_config():
     """Get sample configuration data"""
     return {
@@ -344,6 +347,7 @@ def get_sample_config():
         }
     }
 
+@st.cache_data(show_spinner=False)
 def get_users_data():
     """Get sample users data"""
     return [
@@ -354,6 +358,17 @@ def get_users_data():
         {"Name": "Admin User", "Email": "admin@eventiq.com", "Role": "Admin", "Status": "Active", "Last Login": "2025-01-30 16:00"},
     ]
 
+@st.cache_data(show_spinner=False)
+def _users_df():
+    """Build the users DataFrame once and reuse it across reruns"""
+    return pd.DataFrame(get_users_data()).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_data(show_spinner=False)
+def _users_csv():
+    """Serialize the users export once so the download payload is precomputed"""
+    return _users_df().to_csv(index=False)
+
+@st.cache_data(show_spinner=False)
 def get_user_template_data():
     """Get user import template data"""
     return {
@@ -363,6 +378,7 @@ def get_user_template_data():
         "Status": ["Active", "Active"]
     }
 
+@st.cache_data(show_spinner=False)
 def get_security_logs():
     """Get sample security logs"""
     return [
@@ -4,103 +4,311 @@ Shared utilities and imports for EventIQ modules
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import time
 import json
 import os
 import base64
-from PIL import Image
+import hashlib
+import binascii
 import io
+import mmap
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000/api/v1"
+API_TIMEOUT = (3.05, 30)
+
+_logger = logging.getLogger(__name__)
+
+# Shared session so API calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    # Retry only gateway errors: an offline or stalled backend should fail fast instead of stalling every rerun
+    max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 # File Upload Helper Functions
+def _ensure_dir(folder):
+    """Create an upload folder if it is missing"""
+    # Not cached: the folder can be removed while the app runs, and makedirs is a single stat when it exists
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+def _upload_fingerprint(uploaded_file, size):
+    """Content fingerprint of an upload from its name, size and full contents"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(uploaded_file.name.encode())
+    digest.update(str(size).encode())
+    if hasattr(uploaded_file, "getbuffer"):
+        with uploaded_file.getbuffer() as view:
+            digest.update(view)
+    else:
+        uploaded_file.seek(0)
+        for chunk in iter(lambda: uploaded_file.read(1 << 20), b""):
+            digest.update(chunk)
+        uploaded_file.seek(0)
+    return digest.hexdigest()
+
+def _write_all(fd, data):
+    """Write a whole buffer to a raw file descriptor, retrying short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    return len(data)
+
+def _write_upload_fd(fd, uploaded_file, size=None):
+    """Write an upload to a raw file descriptor and return the number of bytes written"""
+    # Reserve the blocks up front so the filesystem does not grow the file write by write
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+    
+    written = 0
+    if hasattr(uploaded_file, "getbuffer"):
+        with uploaded_file.getbuffer() as view:
+            written = _write_all(fd, view)
+    else:
+        # Stream other file-like objects in 1 MiB chunks
+        uploaded_file.seek(0)
+        for chunk in iter(lambda: uploaded_file.read(1 << 20), b""):
+            written += _write_all(fd, chunk)
+    
+    if size and written != size:
+        os.ftruncate(fd, written)
+    return written
+
+def _write_upload(file_path, uploaded_file, size=None):
+    """Write an upload to a temporary path and rename it into place, returning the bytes written"""
+    # A failed write must not leave a preallocated file behind for the size check in _save_upload to reuse
+    tmp_path = f"{file_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            written = _write_upload_fd(fd, uploaded_file, size)
+        finally:
+            # Saved uploads are rarely read back soon, so let the kernel drop them from the page cache
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return written
+
 def save_uploaded_file(uploaded_file, folder="uploads"):
     """Save uploaded file and return file info"""
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    _ensure_dir(folder)
+    return _save_upload(uploaded_file, folder)
+
+def save_uploaded_files(uploaded_files, folder="uploads"):
+    """Save several uploaded files concurrently and return their file info in order"""
+    _ensure_dir(folder)
+    if len(uploaded_files) < 2:
+        return [_save_upload(uploaded_file, folder) for uploaded_file in uploaded_files]
+    
+    # Raw writes release the GIL, so a small pool overlaps the per-file I/O
+    with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as pool:
+        return list(pool.map(lambda uploaded_file: _save_upload(uploaded_file, folder), uploaded_files))
+
+def _save_upload(uploaded_file, folder):
+    """Write an upload into an existing folder and return file info"""
+    size = getattr(uploaded_file, "size", None)
+    if size is None:
+        file_path = os.path.join(folder, uploaded_file.name)
+    else:
+        stem, ext = os.path.splitext(uploaded_file.name)
+        file_path = os.path.join(folder, f"{stem}-{_upload_fingerprint(uploaded_file, size)}{ext}")
     
-    file_path = os.path.join(folder, uploaded_file.name)
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    # Reruns re-submit the same upload, so a fingerprinted copy of the same size is reused
+    if size is None or not (os.path.isfile(file_path) and os.path.getsize(file_path) == size):
+        size = _write_upload(file_path, uploaded_file, size)
     
     return {
         "name": uploaded_file.name,
-        "size": len(uploaded_file.getvalue()),
+        "size": size,
         "type": uploaded_file.type,
         "path": file_path
     }
 
 def get_file_info(uploaded_file):
-    """Get file information without saving"""
-    return {
+    """Get file information without saving (cached on the file object)"""
+    cached_info = getattr(uploaded_file, "_cached_info", None)
+    if cached_info is not None:
+        return cached_info
+    
+    # UploadedFile exposes .size; getbuffer() is a zero-copy fallback
+    size = getattr(uploaded_file, "size", None)
+    if size is None:
+        size = len(uploaded_file.getbuffer())
+    
+    file_info = {
         "name": uploaded_file.name,
-        "size": len(uploaded_file.getvalue()),
+        "size": size,
         "type": uploaded_file.type,
-        "size_mb": len(uploaded_file.getvalue()) / (1024 * 1024)
+        "size_mb": size / (1024 * 1024)
     }
+    uploaded_file._cached_info = file_info
+    return file_info
+
+def preview_csv_upload(uploaded_file, nrows=5):
+    """Parse only the first rows of an uploaded CSV and count the rest without parsing"""
+    uploaded_file.seek(0)
+    # Keep raw strings for the preview: skips type inference and shows values as entered
+    preview_df = pd.read_csv(uploaded_file, nrows=nrows, dtype=str, dtype_backend="pyarrow")
+    uploaded_file.seek(0)
+    row_count = max(sum(1 for line in uploaded_file if line.strip()) - 1, 0)
+    uploaded_file.seek(0)
+    return preview_df, row_count
+
+# Image preview details, pre-dedented so each render is a single str.format
+_PREVIEW_TMPL = """**📊 File Details:**
+- 📁 Name: {name}
+- 📏 Size: {size_mb:.2f} MB
+- 🎨 Type: {type}
+- 📐 Dimensions: {width} x {height} pixels"""
+
+def _image_thumbnail(uploaded_file):
+    """Decode a 200 px preview thumbnail and read the full dimensions from the header"""
+    from PIL import Image
+    
+    uploaded_file.seek(0)
+    with Image.open(uploaded_file) as image:
+        dimensions = image.size
+        # JPEG draft mode lets libjpeg decode at a reduced scale instead of full resolution
+        image.draft('RGB', (400, 400))
+        image.thumbnail((200, 200), Image.Resampling.LANCZOS)
+        # Small images skip the resize, so load the pixels before the file is closed
+        image.load()
+    uploaded_file.seek(0)
+    return image, dimensions
+
+# Bounded so thumbnails from every session's uploads are not held for the life of the process
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
+def _cached_thumbnail(file_key, _uploaded_file):
+    """Decode a preview thumbnail once per file_id"""
+    return _image_thumbnail(_uploaded_file)
+
+def _preview_thumbnail(uploaded_file):
+    """Get a preview thumbnail and the full image dimensions"""
+    # The cache is shared across sessions, so key on the upload's unique file_id rather than its name
+    file_id = getattr(uploaded_file, "file_id", None)
+    if file_id is None:
+        return _image_thumbnail(uploaded_file)
+    return _cached_thumbnail((file_id, uploaded_file.size), uploaded_file)
 
 def display_image_preview(uploaded_file):
     """Display image preview with file info"""
     if uploaded_file.type.startswith('image/'):
-        image = Image.open(uploaded_file)
-        st.image(image, caption=f"📸 {uploaded_file.name}", width=200)
+        file_info = get_file_info(uploaded_file)
+        thumbnail, dimensions = _preview_thumbnail(uploaded_file)
+        st.image(thumbnail, caption=f"📸 {uploaded_file.name}", width=200)
         
         # Display metadata
-        st.markdown(f"""
-        **📊 File Details:**
-        - 📁 Name: {uploaded_file.name}
-        - 📏 Size: {len(uploaded_file.getvalue()) / (1024 * 1024):.2f} MB
-        - 🎨 Type: {uploaded_file.type}
-        - 📐 Dimensions: {image.size[0]} x {image.size[1]} pixels
-        """)
+        st.markdown(_PREVIEW_TMPL.format(
+            name=uploaded_file.name,
+            size_mb=file_info["size_mb"],
+            type=uploaded_file.type,
+            width=dimensions[0],
+            height=dimensions[1]
+        ))
     else:
         st.info(f"📄 {uploaded_file.name} ({uploaded_file.type})")
 
+def get_image_size(uploaded_file):
+    """Read image dimensions from the file header without decoding pixel data"""
+    from PIL import Image
+    
+    uploaded_file.seek(0)
+    with Image.open(uploaded_file) as image:
+        size = image.size
+    uploaded_file.seek(0)
+    return size
+
 def get_base64_encoded_file(uploaded_file):
     """Convert uploaded file to base64 encoding"""
-    return base64.b64encode(uploaded_file.getvalue()).decode()
+    if hasattr(uploaded_file, "getbuffer"):
+        # getbuffer() is a zero-copy view, unlike getvalue() which copies the bytes
+        return base64.b64encode(uploaded_file.getbuffer()).decode('ascii')
+    
+    # Other file objects are encoded in 3 MiB chunks; a multiple of 3 keeps padding out of the middle
+    uploaded_file.seek(0)
+    encoded = io.StringIO()
+    for chunk in iter(lambda: uploaded_file.read(3 << 20), b""):
+        encoded.write(binascii.b2a_base64(chunk, newline=False).decode('ascii'))
+    return encoded.getvalue()
+
+def get_base64_encoded_path(file_path):
+    """Base64-encode a saved file through a read-only memory map instead of reading it into a bytes copy"""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode('ascii')
 
 def make_api_request(endpoint, method="GET", data=None):
     """Make API request with error handling"""
     try:
-        url = f"{API_BASE_URL}{endpoint}"
-        if method == "GET":
-            response = requests.get(url)
-        elif method == "POST":
-            response = requests.post(url, json=data)
-        elif method == "PUT":
-            response = requests.put(url, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url)
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-    except:
+        # Session.request dispatches on the verb itself; json is only sent when there is a body
+        kwargs = {'json': data} if data is not None else {}
+        response = _SESSION.request(method.upper(), f"{API_BASE_URL}{endpoint}", timeout=API_TIMEOUT, **kwargs)
+        response.raise_for_status()
+        return response.json() if response.content else {}
+    except (requests.RequestException, ValueError) as e:
+        _logger.warning("API request %s %s failed: %s", method, endpoint, e)
         return None
 
+def make_api_requests(endpoints):
+    """Fetch several GET endpoints concurrently over the shared session, results in order"""
+    if len(endpoints) < 2:
+        return [make_api_request(endpoint) for endpoint in endpoints]
+    
+    # Requests overlap on pooled connections, so N calls cost about one round trip
+    with ThreadPoolExecutor(max_workers=min(8, len(endpoints))) as pool:
+        return list(pool.map(make_api_request, endpoints))
+
 def format_currency(amount):
     """Format amount as currency"""
     return f"${amount:,.2f}"
 
+if ciso8601 is not None:
+    _parse_iso_datetime = ciso8601.parse_datetime
+else:
+    def _parse_iso_datetime(dt_string):
+        """Parse an ISO-8601 string with the stdlib parser, accepting a trailing Z"""
+        if dt_string.endswith('Z'):
+            dt_string = dt_string[:-1] + '+00:00'
+        return datetime.fromisoformat(dt_string)
+
 def format_datetime(dt_string):
     """Format datetime string for display"""
     try:
-        dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except:
+        dt = _parse_iso_datetime(dt_string)
+    except (TypeError, ValueError, AttributeError):
         return dt_string
+    # Plain field formatting skips strftime's locale-aware machinery
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
 def show_success_animation():
     """Show success animation with balloons"""
     st.balloons()
-    time.sleep(0.5)
 
 def validate_file_upload(uploaded_file, max_size_mb=50, allowed_types=None):
     """Validate uploaded file"""
@@ -108,13 +316,13 @@ def validate_file_upload(uploaded_file, max_size_mb=50, allowed_types=None):
         return False, "No file selected"
     
     # Check file size
-    file_size_mb = len(uploaded_file.getvalue()) / (1024 * 1024)
+    file_size_mb = get_file_info(uploaded_file)["size_mb"]
     if file_size_mb > max_size_mb:
         return False, f"File size ({file_size_mb:.1f} MB) exceeds maximum allowed size ({max_size_mb} MB)"
     
-    # Check file type
+    # Check file type (a set gives O(1) membership)
     if allowed_types and uploaded_file.type not in allowed_types:
-        return False, f"File type {uploaded_file.type} not allowed. Allowed types: {', '.join(allowed_types)}"
+        return False, f"File type {uploaded_file.type} not allowed. Allowed types: {', '.join(sorted(allowed_types))}"
     
     return True, "File is valid"
 
@@ -4,6 +4,69 @@ Team Member: [Vendor Management Team]
 """
 
 from .utils import *
+import numpy as np
+from types import MappingProxyType
+
+# Static demo tables and chart series, built once at import instead of on every rerun
+_PAYMENT_DF = pd.DataFrame([
+    {"Vendor": "Coffee Express", "Amount": "$2,500", "Due Date": "2025-01-25", "Status": "Paid", "Method": "Bank Transfer"},
+    {"Vendor": "Tech Solutions", "Amount": "$1,800", "Due Date": "2025-02-01", "Status": "Pending", "Method": "Check"},
+    {"Vendor": "Security Plus", "Amount": "$3,200", "Due Date": "2025-01-30", "Status": "Not Sent", "Method": "Wire Transfer"},
+    {"Vendor": "Clean Masters", "Amount": "$800", "Due Date": "2025-01-20", "Status": "Paid", "Method": "Credit Card"},
+    {"Vendor": "Decorative Dreams", "Amount": "$1,500", "Due Date": "2025-01-22", "Status": "Paid", "Method": "Bank Transfer"},
+]).convert_dtypes(dtype_backend="pyarrow")
+
+_COMM_HISTORY_DF = pd.DataFrame([
+    {"Date": "2025-01-30", "Vendor": "Coffee Express", "Type": "Email", "Subject": "Setup Instructions", "Status": "Sent"},
+    {"Date": "2025-01-29", "Vendor": "Tech Solutions", "Type": "Phone", "Subject": "Equipment Confirmation", "Status": "Completed"},
+    {"Date": "2025-01-28", "Vendor": "Security Plus", "Type": "Meeting", "Subject": "Security Briefing", "Status": "Scheduled"},
+    {"Date": "2025-01-27", "Vendor": "Clean Masters", "Type": "Email", "Subject": "Service Agreement", "Status": "Delivered"},
+    {"Date": "2025-01-26", "Vendor": "Decorative Dreams", "Type": "Contract", "Subject": "Contract Renewal", "Status": "Signed"},
+]).convert_dtypes(dtype_backend="pyarrow")
+
+_SERVICE_DISTRIBUTION = {
+    "Catering": 3, "AV Equipment": 2, "Security": 2, "Cleaning": 2,
+    "Decoration": 2, "Photography": 2, "Transportation": 1, "Entertainment": 1
+}
+_PAYMENT_DISTRIBUTION = {"Paid": 8, "Pending": 3, "Not Sent": 2, "Overdue": 2}
+_PERFORMANCE_BUCKETS = {
+    "Excellent (4.5-5.0)": 6,
+    "Good (4.0-4.4)": 7,
+    "Average (3.5-3.9)": 2,
+    "Below Average (<3.5)": 0
+}
+
+# Widget option lists, shared across reruns
+_SERVICE_FILTERS = ("All", "Catering", "AV Equipment", "Security", "Cleaning", "Transportation", "Decoration", "Photography")
+_STATUS_FILTERS = ("All", "Active", "Pending", "Inactive", "Cancelled")
+_VENDOR_SERVICES = (
+    "Catering", "AV Equipment", "Security", "Cleaning", 
+    "Transportation", "Decoration", "Photography", "Entertainment", "Other"
+)
+_PAYMENT_TERMS = ("Net 30", "Net 15", "Upon Completion", "50% Advance", "Payment on Delivery")
+_SERVICE_GROUPS = ("Catering", "AV Equipment", "Security", "Cleaning", "Decoration")
+
+# Read-only template table; the category options are its own key objects,
+# so the selected value hits the dict by identity
+_MESSAGE_TEMPLATES = MappingProxyType({
+    "Welcome": "Welcome to EventIQ 2025! We're excited to have you as our vendor partner.",
+    "Contract": "Please find attached your vendor contract for EventIQ 2025. Please review and return signed copy.",
+    "Payment": "This is a reminder that your payment of {amount} is due on {date}.",
+    "Setup Instructions": "Please find attached your booth setup instructions for EventIQ 2025.",
+    "Reminders": "Reminder: {event} is scheduled for {date} at {time}.",
+    "Thank You": "Thank you for your excellent service at EventIQ 2025!",
+    "Emergency": "URGENT: Please contact event coordination immediately regarding {issue}.",
+    "General Updates": "EventIQ 2025 Update: {message}"
+})
+_TEMPLATE_CATEGORIES = tuple(_MESSAGE_TEMPLATES)
+
+# Low-cardinality columns stored as categories so equality filters compare integer codes
+_VENDOR_CATEGORIES = ("Service", "Status", "Payment_Status", "Insurance")
+
+# Contract is not listed: printf-style column formats have no digit grouping, so it is shown as "$2,500" text
+_VENDOR_COLUMNS = {
+    "Rating": st.column_config.NumberColumn("Rating", format="%.1f"),
+}
 
 def show_vendors_page():
     """Enhanced vendor management page"""
@@ -35,24 +98,21 @@ def show_vendor_directory():
     with col1:
         search_term = st.text_input("🔍 Search vendors:")
     with col2:
-        service_filter = st.selectbox("Filter by Service:", ["All", "Catering", "AV Equipment", "Security", "Cleaning", "Transportation", "Decoration", "Photography"])
+        service_filter = st.selectbox("Filter by Service:", _SERVICE_FILTERS)
     with col3:
-        status_filter = st.selectbox("Filter by Status:", ["All", "Active", "Pending", "Inactive", "Cancelled"])
-    
-    # Get vendor data
-    vendor_data = get_vendor_data()
-    df = pd.DataFrame(vendor_data)
+        status_filter = st.selectbox("Filter by Status:", _STATUS_FILTERS)
     
     # Apply filters
-    df = apply_vendor_filters(df, search_term, service_filter, status_filter)
+    df = apply_vendor_filters(_vendor_df(), search_term, service_filter, status_filter)
     
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.dataframe(df.assign(Contract=df["Contract"].map("${:,}".format)),
+                 use_container_width=True, hide_index=True, column_config=_VENDOR_COLUMNS)
     
     # Vendor actions
     show_vendor_actions()
     
     # Individual vendor management
-    show_individual_vendor_management(vendor_data)
+    show_individual_vendor_management()
 
 def show_add_vendor():
     """Add new vendor interface"""
@@ -111,6 +171,7 @@ def show_vendor_communications():
     with tab5_3:
         show_message_templates()
 
+@st.cache_data(show_spinner=False)
 def get_vendor_data():
     """Get enhanced vendor data"""
     return [
@@ -186,16 +247,52 @@ def get_vendor_data():
         }
     ]
 
+@st.cache_data(show_spinner=False)
+def _vendor_df():
+    """Build the vendor DataFrame once and reuse it across reruns"""
+    df = pd.DataFrame(get_vendor_data()).convert_dtypes(dtype_backend="pyarrow")
+    df["Contract"] = df["Contract"].str.replace(r"[$,]", "", regex=True)
+    return df.astype({
+        **dict.fromkeys(_VENDOR_CATEGORIES, "category"),
+        "Contract": "int32[pyarrow]",
+        "Rating": "float32[pyarrow]",
+    })
+
+@st.cache_data(show_spinner=False)
+def _vendor_index():
+    """Map vendor names to their records for constant-time lookup"""
+    return {v["Name"]: v for v in get_vendor_data()}
+
+@st.cache_data(show_spinner=False)
+def _vendor_names():
+    """List vendor names once for the selectors"""
+    return [v["Name"] for v in get_vendor_data()]
+
+def _session_vendors():
+    """Return the vendor index and names, copied out of the data cache once per session"""
+    if 'vendor_data_cache' not in st.session_state:
+        st.session_state.vendor_data_cache = (_vendor_index(), _vendor_names())
+    return st.session_state.vendor_data_cache
+
+@st.cache_data(show_spinner=False)
+def _vendor_contracts():
+    """Read vendor names and parsed contract amounts as (names, amounts) tuples for the bar chart"""
+    df = _vendor_df()
+    return tuple(df["Name"].tolist()), tuple(df["Contract"].tolist())
+
 def apply_vendor_filters(df, search_term, service_filter, status_filter):
     """Apply filters to vendor dataframe"""
+    # Combine filters in one preallocated ndarray so each step skips Series index alignment
+    mask = np.ones(len(df), dtype=bool)
     if search_term:
-        df = df[df['Name'].str.contains(search_term, case=False) | 
-               df['Service'].str.contains(search_term, case=False)]
+        # Case-insensitive matching runs in Arrow on the strings and on the categories, with no lowercased copies
+        mask &= (df['Name'].str.contains(search_term, case=False, regex=False, na=False).to_numpy(dtype=bool) |
+                 df['Service'].str.contains(search_term, case=False, regex=False, na=False).to_numpy(dtype=bool))
     if service_filter != "All":
-        df = df[df['Service'] == service_filter]
+        mask &= df['Service'].eq(service_filter).to_numpy(dtype=bool)
     if status_filter != "All":
-        df = df[df['Status'] == status_filter]
-    return df
+        mask &= df['Status'].eq(status_filter).to_numpy(dtype=bool)
+    return df[mask]
 
 def show_vendor_actions():
     """Display vendor action buttons"""
@@ -214,27 +311,28 @@ def show_vendor_actions():
         if st.button("📋 Export Directory", use_container_width=True):
             st.success("Vendor directory exported")
 
-def show_individual_vendor_management(vendor_data):
+def show_individual_vendor_management():
     """Individual vendor management interface"""
     st.markdown("#### 👤 Individual Vendor Management")
-    selected_vendor = st.selectbox("Select Vendor:", [v["Name"] for v in vendor_data])
+    vendor_index, vendor_names = _session_vendors()
+    selected_vendor = st.selectbox("Select Vendor:", vendor_names)
     
-    vendor_info = next(v for v in vendor_data if v["Name"] == selected_vendor)
+    vendor_info = vendor_index[selected_vendor]
     
-    # Display vendor details
+    # Display vendor details as one markdown block per column; trailing double spaces break lines
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(f"**Service:** {vendor_info['Service']}")
-        st.write(f"**Status:** {vendor_info['Status']}")
-        st.write(f"**Rating:** ⭐ {vendor_info['Rating']}/5.0")
+        st.markdown(f"**Service:** {vendor_info['Service']}  \n"
+                    f"**Status:** {vendor_info['Status']}  \n"
+                    f"**Rating:** ⭐ {vendor_info['Rating']}/5.0")
     with col2:
-        st.write(f"**Contract:** {vendor_info['Contract']}")
-        st.write(f"**Payment:** {vendor_info['Payment_Status']}")
-        st.write(f"**Booth:** {vendor_info['Booth']}")
+        st.markdown(f"**Contract:** {vendor_info['Contract']}  \n"
+                    f"**Payment:** {vendor_info['Payment_Status']}  \n"
+                    f"**Booth:** {vendor_info['Booth']}")
     with col3:
-        st.write(f"**Insurance:** {vendor_info['Insurance']}")
-        st.write(f"**Setup Date:** {vendor_info['Setup_Date']}")
-        st.write(f"**Last Contact:** {vendor_info['Last_Contact']}")
+        st.markdown(f"**Insurance:** {vendor_info['Insurance']}  \n"
+                    f"**Setup Date:** {vendor_info['Setup_Date']}  \n"
+                    f"**Last Contact:** {vendor_info['Last_Contact']}")
     
     # Action buttons
     col1, col2, col3, col4 = st.columns(4)
@@ -261,10 +359,7 @@ def show_basic_vendor_form():
     vendor_address = st.text_area("Address:")
     
     st.markdown("#### 📋 Service Details")
-    vendor_service = st.selectbox("Primary Service:", [
-        "Catering", "AV Equipment", "Security", "Cleaning", 
-        "Transportation", "Decoration", "Photography", "Entertainment", "Other"
-    ])
+    vendor_service = st.selectbox("Primary Service:", _VENDOR_SERVICES)
     service_description = st.text_area("Service Description:")
     materials_brought = st.text_area("Materials/Equipment Provided:")
     
@@ -283,7 +378,7 @@ def show_vendor_documents_form():
     """Vendor documents and contract form"""
     st.markdown("#### 💰 Contract Information")
     contract_amount = st.number_input("Contract Amount ($):", min_value=0.0, step=100.0)
-    payment_terms = st.selectbox("Payment Terms:", ["Net 30", "Net 15", "Upon Completion", "50% Advance", "Payment on Delivery"])
+    payment_terms = st.selectbox("Payment Terms:", _PAYMENT_TERMS)
     booth_required = st.checkbox("Booth Space Required")
     preferred_booth = ""
     if booth_required:
@@ -368,15 +463,17 @@ def show_vendor_save_button(vendor_info, contract_info, documents):
     """Show save vendor button and handle saving"""
     if st.button("💾 Add Vendor", use_container_width=True):
         if vendor_info['name'] and vendor_info['email']:
-            # Process uploaded documents
+            # Save uploaded documents to disk; session state keeps the path instead of an encoded copy
             vendor_documents = {}
-            for doc_type, doc_file in documents.items():
-                if doc_file:
+            doc_files = {doc_type: doc_file for doc_type, doc_file in documents.items() if doc_file}
+            if doc_files:
+                saved_files = save_uploaded_files(list(doc_files.values()), "vendors/documents")
+                for (doc_type, doc_file), saved in zip(doc_files.items(), saved_files):
                     vendor_documents[doc_type] = {
                         "name": doc_file.name,
                         "type": doc_file.type,
-                        "size": get_file_info(doc_file)['size_mb'],
-                        "data": get_base64_encoded_file(doc_file)
+                        "size": saved["size"] / (1024 * 1024),
+                        "path": saved["path"]
                     }
             
             # Store vendor information
@@ -386,12 +483,11 @@ def show_vendor_save_button(vendor_info, contract_info, documents):
 
 def save_new_vendor(vendor_info, contract_info, vendor_documents):
     """Save new vendor to session state"""
-    new_vendor = {
-        **vendor_info,
-        **contract_info,
-        "documents": vendor_documents,
-        "date_added": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
+    # The two form dicts have disjoint keys, so update() merges them into one copy
+    new_vendor = dict(vendor_info)
+    new_vendor.update(contract_info)
+    new_vendor["documents"] = vendor_documents
+    new_vendor["date_added"] = datetime.now().isoformat(sep=" ", timespec="seconds")
     
     if 'vendors' not in st.session_state:
         st.session_state.vendors = []
@@ -423,44 +519,44 @@ def show_vendor_charts():
     col1, col2 = st.columns(2)
     with col1:
         # Service type distribution
-        service_data = {
-            "Catering": 3, "AV Equipment": 2, "Security": 2, "Cleaning": 2,
-            "Decoration": 2, "Photography": 2, "Transportation": 1, "Entertainment": 1
-        }
-        fig = px.pie(values=list(service_data.values()), names=list(service_data.keys()), 
-                    title="Vendors by Service Type")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_pie_figure(tuple(_SERVICE_DISTRIBUTION), tuple(_SERVICE_DISTRIBUTION.values()),
+                                    "Vendors by Service Type"), use_container_width=True)
     
     with col2:
         # Contract amounts by vendor
-        amounts = [2500, 1800, 3200, 800, 1500]
-        vendors = ["Coffee Express", "Tech Solutions", "Security Plus", "Clean Masters", "Decorative Dreams"]
-        fig = px.bar(x=vendors, y=amounts, title="Contract Amounts by Vendor")
-        fig.update_xaxis(tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_figure(*_vendor_contracts(), "Contract Amounts by Vendor"), use_container_width=True)
 
 def show_payment_analysis():
     """Display payment status analysis"""
     st.markdown("#### 💰 Payment Status Analysis")
-    payment_data = {"Paid": 8, "Pending": 3, "Not Sent": 2, "Overdue": 2}
     col1, col2 = st.columns(2)
     with col1:
-        fig = px.pie(values=list(payment_data.values()), names=list(payment_data.keys()),
-                    title="Payment Status Distribution")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_pie_figure(tuple(_PAYMENT_DISTRIBUTION), tuple(_PAYMENT_DISTRIBUTION.values()),
+                                    "Payment Status Distribution"), use_container_width=True)
     
     with col2:
         # Vendor performance ratings
-        performance_data = {
-            "Excellent (4.5-5.0)": 6,
-            "Good (4.0-4.4)": 7,
-            "Average (3.5-3.9)": 2,
-            "Below Average (<3.5)": 0
-        }
-        fig = px.bar(x=list(performance_data.keys()), y=list(performance_data.values()),
-                    title="Vendor Performance Ratings")
-        fig.update_xaxis(tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_figure(tuple(_PERFORMANCE_BUCKETS), tuple(_PERFORMANCE_BUCKETS.values()),
+                                    "Vendor Performance Ratings"), use_container_width=True)
+
+@st.cache_resource(show_spinner=False)
+def _pie_figure(names, values, title):
+    """Build a pie chart once per distinct set of inputs"""
+    import plotly.express as px
+    
+    fig = px.pie(values=values, names=names, title=title)
+    fig.update_layout(uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _bar_figure(x, y, title):
+    """Build a bar chart with angled labels once per distinct set of inputs"""
+    import plotly.express as px
+    
+    fig = px.bar(x=x, y=y, title=title)
+    fig.update_xaxes(tickangle=45)
+    fig.update_layout(uirevision="static")
+    return fig
 
 def show_payment_overview():
     """Display payment overview metrics"""
@@ -477,16 +573,7 @@ def show_payment_overview():
 def show_payment_tracking():
     """Display payment tracking table"""
     st.markdown("#### 📋 Payment Tracking")
-    payment_data = [
-        {"Vendor": "Coffee Express", "Amount": "$2,500", "Due Date": "2025-01-25", "Status": "Paid", "Method": "Bank Transfer"},
-        {"Vendor": "Tech Solutions", "Amount": "$1,800", "Due Date": "2025-02-01", "Status": "Pending", "Method": "Check"},
-        {"Vendor": "Security Plus", "Amount": "$3,200", "Due Date": "2025-01-30", "Status": "Not Sent", "Method": "Wire Transfer"},
-        {"Vendor": "Clean Masters", "Amount": "$800", "Due Date": "2025-01-20", "Status": "Paid", "Method": "Credit Card"},
-        {"Vendor": "Decorative Dreams", "Amount": "$1,500", "Due Date": "2025-01-22", "Status": "Paid", "Method": "Bank Transfer"},
-    ]
-    
-    payment_df = pd.DataFrame(payment_data)
-    st.dataframe(payment_df, use_container_width=True, hide_index=True)
+    st.dataframe(_PAYMENT_DF, use_container_width=True, hide_index=True)
 
 def show_payment_actions():
     """Display payment action buttons"""
@@ -552,15 +639,13 @@ def show_send_messages():
 
 def get_message_recipients(message_type):
     """Get message recipients based on type"""
-    vendor_data = get_vendor_data()
-    
     if message_type == "Individual":
-        return st.multiselect("Select Vendor:", [v["Name"] for v in vendor_data])
+        return st.multiselect("Select Vendor:", _session_vendors()[1])
     elif message_type == "Bulk":
         st.write("Message will be sent to all vendors")
         return "All Vendors"
     else:
-        service_group = st.selectbox("Select Service Group:", ["Catering", "AV Equipment", "Security", "Cleaning", "Decoration"])
+        service_group = st.selectbox("Select Service Group:", _SERVICE_GROUPS)
         return f"All {service_group} vendors"
 
 def handle_message_attachments():
@@ -569,22 +654,20 @@ def handle_message_attachments():
     
     if attachments:
         st.markdown("##### 📎 Selected Attachments:")
-        total_size = 0
-        for attachment in attachments:
-            file_info = get_file_info(attachment)
-            total_size += file_info['size_mb']
-            
+        sizes = [get_file_info(attachment)['size_mb'] for attachment in attachments]
+        # Index-based keys stay unique when two attachments share a filename
+        for i, (attachment, size_mb) in enumerate(zip(attachments, sizes)):
             col_a, col_b, col_c = st.columns([3, 1, 1])
             with col_a:
                 st.write(f"📄 {attachment.name}")
             with col_b:
-                st.write(f"{file_info['size_mb']:.2f} MB")
+                st.write(f"{size_mb:.2f} MB")
             with col_c:
                 if attachment.type.startswith('image/'):
-                    if st.button("👁️", key=f"preview_attach_{attachment.name}"):
+                    if st.button("👁️", key=f"preview_attach_{i}"):
                         display_image_preview(attachment)
         
-        st.info(f"Total size: {total_size:.2f} MB")
+        st.info(f"Total size: {sum(sizes):.2f} MB")
         
         # Sample attachments
         if st.button("📁 Add Sample Contract", key="sample_contract_comm"):
@@ -613,12 +696,13 @@ def store_vendor_message(message_subject, message_body, recipients, message_prio
     processed_attachments = []
     
     if attachments:
-        for attachment in attachments:
+        saved_files = save_uploaded_files(attachments, "vendors/attachments")
+        for attachment, saved in zip(attachments, saved_files):
             processed_attachments.append({
                 "name": attachment.name,
                 "type": attachment.type,
-                "size": get_file_info(attachment)['size_mb'],
-                "data": get_base64_encoded_file(attachment)
+                "size": saved["size"] / (1024 * 1024),
+                "path": saved["path"]
             })
     
     # Store message
@@ -626,7 +710,7 @@ def store_vendor_message(message_subject, message_body, recipients, message_prio
         st.session_state.vendor_messages = []
     
     new_message = {
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": datetime.now().isoformat(sep=" ", timespec="seconds"),
         "recipients": recipients,
         "subject": message_subject,
         "body": message_body,
@@ -652,24 +736,13 @@ def show_message_history():
     # Filter options
     col1, col2, col3 = st.columns(3)
     with col1:
-        vendor_data = get_vendor_data()
-        history_vendor = st.selectbox("Filter by Vendor:", ["All"] + [v["Name"] for v in vendor_data])
+        history_vendor = st.selectbox("Filter by Vendor:", ["All", *_session_vendors()[1]])
     with col2:
         history_date = st.date_input("From Date:")
     with col3:
         history_type = st.selectbox("Message Type:", ["All", "Email", "Phone", "Meeting", "Contract"])
     
-    # Sample communication history
-    comm_history = [
-        {"Date": "2025-01-30", "Vendor": "Coffee Express", "Type": "Email", "Subject": "Setup Instructions", "Status": "Sent"},
-        {"Date": "2025-01-29", "Vendor": "Tech Solutions", "Type": "Phone", "Subject": "Equipment Confirmation", "Status": "Completed"},
-        {"Date": "2025-01-28", "Vendor": "Security Plus", "Type": "Meeting", "Subject": "Security Briefing", "Status": "Scheduled"},
-        {"Date": "2025-01-27", "Vendor": "Clean Masters", "Type": "Email", "Subject": "Service Agreement", "Status": "Delivered"},
-        {"Date": "2025-01-26", "Vendor": "Decorative Dreams", "Type": "Contract", "Subject": "Contract Renewal", "Status": "Signed"},
-    ]
-    
-    history_df = pd.DataFrame(comm_history)
-    st.dataframe(history_df, use_container_width=True, hide_index=True)
+    st.dataframe(_COMM_HISTORY_DF, use_container_width=True, hide_index=True)
 
 def show_message_templates():
     """Display message templates management"""
@@ -678,10 +751,7 @@ def show_message_templates():
     # Template management
     col1, col2 = st.columns(2)
     with col1:
-        template_category = st.selectbox("Template Category:", [
-            "Welcome", "Contract", "Payment", "Setup Instructions", 
-            "Reminders", "Thank You", "Emergency", "General Updates"
-        ])
+        template_category = st.selectbox("Template Category:", _TEMPLATE_CATEGORIES)
         
         templates = get_message_templates()
         current_template = templates.get(template_category, "")
@@ -701,13 +771,4 @@ def show_message_templates():
 
 def get_message_templates():
     """Get predefined message templates"""
-    return {
-        "Welcome": "Welcome to EventIQ 2025! We're excited to have you as our vendor partner.",
-        "Contract": "Please find attached your vendor contract for EventIQ 2025. Please review and return signed copy.",
-        "Payment": "This is a reminder that your payment of {amount} is due on {date}.",
-        "Setup Instructions": "Please find attached your booth setup instructions for EventIQ 2025.",
-        "Reminders": "Reminder: {event} is scheduled for {date} at {time}.",
-        "Thank You": "Thank you for your excellent service at EventIQ 2025!",
-        "Emergency": "URGENT: Please contact event coordination immediately regarding {issue}.",
-        "General Updates": "EventIQ 2025 Update: {message}"
-    }
+    return _MESSAGE_TEMPLATES
@@ -4,6 +4,7 @@ Team Member: [Volunteers Team]
 """
 
 from .utils import *
+import plotly.express as px
 
 def show_volunteers_module():
     """Volunteers management interface"""
@@ -23,24 +24,20 @@ def show_volunteers_module():
         with col3:
             status_filter = st.selectbox("Filter by status:", ["All", "Active", "Inactive", "On Break"])
         
-        volunteers_data = [
-            {"Name": "John Smith", "Role": "Registration", "Hours": 15, "Rating": 4.5, "Status": "Active", "Contact": "john@email.com"},
-            {"Name": "Sarah Johnson", "Role": "Information", "Hours": 12, "Rating": 4.8, "Status": "Active", "Contact": "sarah@email.com"},
-            {"Name": "Mike Wilson", "Role": "Security", "Hours": 20, "Rating": 4.2, "Status": "Active", "Contact": "mike@email.com"},
-            {"Name": "Alice Brown", "Role": "Setup", "Hours": 8, "Rating": 4.6, "Status": "Active", "Contact": "alice@email.com"},
-            {"Name": "Tom Davis", "Role": "Cleanup", "Hours": 6, "Rating": 4.3, "Status": "On Break", "Contact": "tom@email.com"},
-        ]
+        df = _volunteers_df()
         
-        df = pd.DataFrame(volunteers_data)
-        
-        # Apply filters
+        # Apply filters as a single combined mask
+        mask = pd.Series(True, index=df.index)
         if search_term:
-            df = df[df['Name'].str.contains(search_term, case=False) | 
-                   df['Role'].str.contains(search_term, case=False)]
+            term = search_term.lower()
+            names_lower, roles_lower = _volunteer_search_lower()
+            mask &= (names_lower.str.contains(term, regex=False, na=False) |
+                     roles_lower.str.contains(term, regex=False, na=False))
         if role_filter != "All":
-            df = df[df['Role'] == role_filter]
+            mask &= df['Role'] == role_filter
         if status_filter != "All":
-            df = df[df['Status'] == status_filter]
+            mask &= df['Status'] == status_filter
+        df = df[mask]
         
         st.dataframe(df, use_container_width=True, hide_index=True)
         
@@ -142,13 +139,7 @@ def show_volunteers_module():
         
         # Performance tracking
         st.markdown("### 📈 Performance Tracking")
-        performance_data = [
-            {"Volunteer": "John Smith", "Tasks Completed": 12, "Rating": 4.5, "Punctuality": "95%"},
-            {"Volunteer": "Sarah Johnson", "Tasks Completed": 10, "Rating": 4.8, "Punctuality": "100%"},
-            {"Volunteer": "Mike Wilson", "Tasks Completed": 15, "Rating": 4.2, "Punctuality": "90%"},
-        ]
-        df_performance = pd.DataFrame(performance_data)
-        st.dataframe(df_performance, use_container_width=True, hide_index=True)
+        st.dataframe(_performance_df(), use_container_width=True, hide_index=True)
     
     with tab4:
         st.markdown("### 📄 Volunteer Documents & Training")
@@ -178,13 +169,7 @@ def show_volunteers_module():
         
         # Training completion tracking
         st.markdown("#### 🎓 Training Completion Status")
-        training_data = [
-            {"Volunteer": "John Smith", "Safety Training": "✅", "Role Training": "✅", "Emergency Procedures": "✅"},
-            {"Volunteer": "Sarah Johnson", "Safety Training": "✅", "Role Training": "✅", "Emergency Procedures": "⏳"},
-            {"Volunteer": "Mike Wilson", "Safety Training": "✅", "Role Training": "⏳", "Emergency Procedures": "❌"},
-        ]
-        df_training = pd.DataFrame(training_data)
-        st.dataframe(df_training, use_container_width=True, hide_index=True)
+        st.dataframe(_training_df(), use_container_width=True, hide_index=True)
         
         # Bulk actions
         st.markdown("#### ⚡ Bulk Actions")
@@ -198,3 +183,41 @@ def show_volunteers_module():
         with col3:
             if st.button("🎓 Mark Training Complete", use_container_width=True):
                 st.success("Training marked as complete!")
+
+# The tables below are shared cache_resource objects rather than per-call cache_data copies.
+# The page only filters them, and boolean indexing already returns a new frame;
+# copy() first if a caller ever needs to change one in place.
+@st.cache_resource(show_spinner=False)
+def _volunteers_df():
+    """Build the volunteers DataFrame once and reuse it across reruns"""
+    return pd.DataFrame([
+        {"Name": "John Smith", "Role": "Registration", "Hours": 15, "Rating": 4.5, "Status": "Active", "Contact": "john@email.com"},
+        {"Name": "Sarah Johnson", "Role": "Information", "Hours": 12, "Rating": 4.8, "Status": "Active", "Contact": "sarah@email.com"},
+        {"Name": "Mike Wilson", "Role": "Security", "Hours": 20, "Rating": 4.2, "Status": "Active", "Contact": "mike@email.com"},
+        {"Name": "Alice Brown", "Role": "Setup", "Hours": 8, "Rating": 4.6, "Status": "Active", "Contact": "alice@email.com"},
+        {"Name": "Tom Davis", "Role": "Cleanup", "Hours": 6, "Rating": 4.3, "Status": "On Break", "Contact": "tom@email.com"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_resource(show_spinner=False)
+def _volunteer_search_lower():
+    """Case-fold the searchable volunteer columns once so searches skip per-call lowercasing"""
+    df = _volunteers_df()
+    return df['Name'].str.lower(), df['Role'].str.lower()
+
+@st.cache_resource(show_spinner=False)
+def _performance_df():
+    """Build the performance tracking table once per process"""
+    return pd.DataFrame([
+        {"Volunteer": "John Smith", "Tasks Completed": 12, "Rating": 4.5, "Punctuality": "95%"},
+        {"Volunteer": "Sarah Johnson", "Tasks Completed": 10, "Rating": 4.8, "Punctuality": "100%"},
+        {"Volunteer": "Mike Wilson", "Tasks Completed": 15, "Rating": 4.2, "Punctuality": "90%"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_resource(show_spinner=False)
+def _training_df():
+    """Build the training completion table once per process"""
+    return pd.DataFrame([
+        {"Volunteer": "John Smith", "Safety Training": "✅", "Role Training": "✅", "Emergency Procedures": "✅"},
+        {"Volunteer": "Sarah Johnson", "Safety Training": "✅", "Role Training": "✅", "Emergency Procedures": "⏳"},
+        {"Volunteer": "Mike Wilson", "Safety Training": "✅", "Role Training": "⏳", "Emergency Procedures": "❌"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
@@ -4,6 +4,7 @@ Team Member: [Workflows Team]
 """
 
 from .utils import *
+import plotly.express as px
 
 def show_workflows_page():
     """Workflows management interface"""
@@ -23,24 +24,17 @@ def show_workflows_page():
         with col3:
             search_workflow = st.text_input("🔍 Search workflows:", placeholder="Enter workflow name...")
         
-        workflows = [
-            {"Name": "Vendor Onboarding", "Status": "Active", "Progress": "75%", "Priority": "High", "Next Step": "Document Review", "Assigned": "John Doe"},
-            {"Name": "Volunteer Training", "Status": "Completed", "Progress": "100%", "Priority": "Medium", "Next Step": "N/A", "Assigned": "Sarah Smith"},
-            {"Name": "Equipment Setup", "Status": "In Progress", "Progress": "45%", "Priority": "High", "Next Step": "Testing Phase", "Assigned": "Mike Wilson"},
-            {"Name": "Catering Coordination", "Status": "Active", "Progress": "60%", "Priority": "Medium", "Next Step": "Menu Approval", "Assigned": "Alice Brown"},
-            {"Name": "Security Briefing", "Status": "Paused", "Progress": "30%", "Priority": "High", "Next Step": "Schedule Meeting", "Assigned": "Tom Davis"},
-        ]
-        
-        # Apply filters
-        filtered_workflows = workflows
+        # Apply filters as a single combined mask
+        df = _workflows_df()
+        mask = pd.Series(True, index=df.index)
         if status_filter != "All":
-            filtered_workflows = [w for w in filtered_workflows if w["Status"] == status_filter]
+            mask &= df["Status"].eq(status_filter)
         if priority_filter != "All":
-            filtered_workflows = [w for w in filtered_workflows if w["Priority"] == priority_filter]
+            mask &= df["Priority"].eq(priority_filter)
         if search_workflow:
-            filtered_workflows = [w for w in filtered_workflows if search_workflow.lower() in w["Name"].lower()]
+            mask &= _workflow_names_lower().str.contains(search_workflow.lower(), regex=False, na=False)
         
-        for workflow in filtered_workflows:
+        for workflow in df[mask].to_dict("records"):
             with st.expander(f"🔄 {workflow['Name']} - {workflow['Status']} ({workflow['Priority']} Priority)"):
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -53,8 +47,7 @@ def show_workflows_page():
                     st.write(f"**Status:** {workflow['Status']}")
                     
                     # Progress bar
-                    progress_val = int(workflow['Progress'].replace('%', ''))
-                    st.progress(progress_val / 100)
+                    st.progress(workflow['progress_pct'] / 100)
                 
                 with col3:
                     if st.button(f"📋 View Details", key=f"workflow_details_{workflow['Name']}"):
@@ -138,8 +131,7 @@ def show_workflows_page():
                         save_uploaded_file(workflow_template, f"workflows/templates/{workflow_name}_{workflow_template.name}")
                     
                     if reference_docs:
-                        for doc in reference_docs:
-                            save_uploaded_file(doc, f"workflows/references/{workflow_name}_{doc.name}")
+                        save_uploaded_files(reference_docs, f"workflows/references/{workflow_name}")
                     
                     st.success(f"✅ Workflow '{workflow_name}' created successfully!")
                     st.info(f"📧 Notification sent to {assigned_to}")
@@ -179,25 +171,11 @@ def show_workflows_page():
         
         # Performance by category
         st.markdown("#### 📈 Performance by Category")
-        category_data = [
-            {"Category": "Event Setup", "Total": 5, "Completed": 4, "Success Rate": "80%", "Avg Duration": "2.5 days"},
-            {"Category": "Vendor Management", "Total": 8, "Completed": 7, "Success Rate": "87%", "Avg Duration": "3.1 days"},
-            {"Category": "Staff Coordination", "Total": 6, "Completed": 6, "Success Rate": "100%", "Avg Duration": "1.8 days"},
-            {"Category": "Technical", "Total": 4, "Completed": 3, "Success Rate": "75%", "Avg Duration": "4.2 days"},
-        ]
-        df_category = pd.DataFrame(category_data)
-        st.dataframe(df_category, use_container_width=True, hide_index=True)
+        st.dataframe(_category_df(), use_container_width=True, hide_index=True)
         
         # Team performance
         st.markdown("#### 👥 Team Performance")
-        team_data = [
-            {"Team Member": "John Doe", "Active Workflows": 3, "Completed": 12, "Success Rate": "95%"},
-            {"Team Member": "Sarah Smith", "Active Workflows": 2, "Completed": 8, "Success Rate": "100%"},
-            {"Team Member": "Mike Wilson", "Active Workflows": 2, "Completed": 6, "Success Rate": "85%"},
-            {"Team Member": "Alice Brown", "Active Workflows": 1, "Completed": 5, "Success Rate": "90%"},
-        ]
-        df_team = pd.DataFrame(team_data)
-        st.dataframe(df_team, use_container_width=True, hide_index=True)
+        st.dataframe(_team_df(), use_container_width=True, hide_index=True)
     
     with tab4:
         st.markdown("### 📄 Workflow Templates & Documentation")
@@ -228,20 +206,12 @@ def show_workflows_page():
         st.markdown("#### 📖 Standard Operating Procedures (SOPs)")
         sop_file = st.file_uploader("Upload SOP Documents", type=['pdf', 'doc', 'docx'], accept_multiple_files=True)
         if sop_file:
-            for doc in sop_file:
-                saved_path = save_uploaded_file(doc, f"workflows/sops/{doc.name}")
+            save_uploaded_files(sop_file, "workflows/sops")
             st.success(f"✅ {len(sop_file)} SOP documents uploaded!")
         
         # Template library
         st.markdown("#### 📚 Template Library")
-        templates_data = [
-            {"Template": "Vendor Onboarding", "Category": "Vendor Management", "Last Updated": "2025-01-20", "Usage": "15 times"},
-            {"Template": "Event Setup Checklist", "Category": "Event Setup", "Last Updated": "2025-01-18", "Usage": "8 times"},
-            {"Template": "Security Protocol", "Category": "Security", "Last Updated": "2025-01-15", "Usage": "5 times"},
-            {"Template": "Equipment Testing", "Category": "Technical", "Last Updated": "2025-01-10", "Usage": "12 times"},
-        ]
-        df_templates = pd.DataFrame(templates_data)
-        st.dataframe(df_templates, use_container_width=True, hide_index=True)
+        st.dataframe(_templates_df(), use_container_width=True, hide_index=True)
         
         # Workflow automation
         st.markdown("#### 🤖 Workflow Automation")
@@ -255,3 +225,59 @@ def show_workflows_page():
         with col3:
             if st.button("📊 Generate SLA Report", use_container_width=True):
                 st.success("SLA compliance report generated!")
+
+@st.cache_data(show_spinner=False)
+def get_workflows_data():
+    """Get sample workflows data"""
+    return [
+        {"Name": "Vendor Onboarding", "Status": "Active", "Progress": "75%", "Priority": "High", "Next Step": "Document Review", "Assigned": "John Doe"},
+        {"Name": "Volunteer Training", "Status": "Completed", "Progress": "100%", "Priority": "Medium", "Next Step": "N/A", "Assigned": "Sarah Smith"},
+        {"Name": "Equipment Setup", "Status": "In Progress", "Progress": "45%", "Priority": "High", "Next Step": "Testing Phase", "Assigned": "Mike Wilson"},
+        {"Name": "Catering Coordination", "Status": "Active", "Progress": "60%", "Priority": "Medium", "Next Step": "Menu Approval", "Assigned": "Alice Brown"},
+        {"Name": "Security Briefing", "Status": "Paused", "Progress": "30%", "Priority": "High", "Next Step": "Schedule Meeting", "Assigned": "Tom Davis"},
+    ]
+
+# Read-only frames are held with cache_resource so reruns get the cached object itself,
+# not an unpickled copy. Filters and to_dict() never modify them; copy() before any in-place edit.
+@st.cache_resource(show_spinner=False)
+def _workflows_df():
+    """Build the workflows DataFrame once and reuse it across reruns"""
+    df = pd.DataFrame(get_workflows_data()).convert_dtypes(dtype_backend="pyarrow")
+    # Parse the "75%" text once here so the render loop feeds st.progress an int directly
+    df["progress_pct"] = df["Progress"].str.rstrip("%").astype("int16[pyarrow]")
+    return df
+
+@st.cache_resource(show_spinner=False)
+def _workflow_names_lower():
+    """Case-fold workflow names once so searches skip per-call lowercasing"""
+    return _workflows_df()["Name"].str.lower()
+
+@st.cache_resource(show_spinner=False)
+def _category_df():
+    """Build the performance by category table once per process"""
+    return pd.DataFrame([
+        {"Category": "Event Setup", "Total": 5, "Completed": 4, "Success Rate": "80%", "Avg Duration": "2.5 days"},
+        {"Category": "Vendor Management", "Total": 8, "Completed": 7, "Success Rate": "87%", "Avg Duration": "3.1 days"},
+        {"Category": "Staff Coordination", "Total": 6, "Completed": 6, "Success Rate": "100%", "Avg Duration": "1.8 days"},
+        {"Category": "Technical", "Total": 4, "Completed": 3, "Success Rate": "75%", "Avg Duration": "4.2 days"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_resource(show_spinner=False)
+def _team_df():
+    """Build the team performance table once per process"""
+    return pd.DataFrame([
+        {"Team Member": "John Doe", "Active Workflows": 3, "Completed": 12, "Success Rate": "95%"},
+        {"Team Member": "Sarah Smith", "Active Workflows": 2, "Completed": 8, "Success Rate": "100%"},
+        {"Team Member": "Mike Wilson", "Active Workflows": 2, "Completed": 6, "Success Rate": "85%"},
+        {"Team Member": "Alice Brown", "Active Workflows": 1, "Completed": 5, "Success Rate": "90%"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_resource(show_spinner=False)
+def _templates_df():
+    """Build the template library table once per process"""
+    return pd.DataFrame([
+        {"Template": "Vendor Onboarding", "Category": "Vendor Management", "Last Updated": "2025-01-20", "Usage": "15 times"},
+        {"Template": "Event Setup Checklist", "Category": "Event Setup", "Last Updated": "2025-01-18", "Usage": "8 times"},
+        {"Template": "Security Protocol", "Category": "Security", "Last Updated": "2025-01-15", "Usage": "5 times"},
+        {"Template": "Equipment Testing", "Category": "Technical", "Last Updated": "2025-01-10", "Usage": "12 times"},
+    ]).convert_dtypes(dtype_backend="pyarrow")
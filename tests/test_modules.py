@@ -55,6 +55,14 @@ class TestDataModels(unittest.TestCase):
         self.assertEqual(booth.section, "Section A")
         self.assertEqual(booth.size, "3x3")
         self.assertEqual(booth.price, 500.0)
+    
+    def test_list_defaults_not_shared(self):
+        """Test list fields default to a fresh empty list per instance"""
+        first = create_booth("A-01", "Section A", "3x3", 500.0)
+        second = create_booth("A-02", "Section A", "3x3", 500.0)
+        first.special_features.append("Corner")
+        self.assertEqual(second.special_features, [])
+        self.assertEqual(create_volunteer("John Doe", "john@example.com", "Registration").availability, [])
 
 class TestFileService(unittest.TestCase):
     """Test file service functionality"""
@@ -82,6 +90,200 @@ class TestFileService(unittest.TestCase):
         
         self.assertTrue(os.path.exists(expected_path))
 
+    def test_save_file_streams_content(self):
+        """Test saved file content matches the upload"""
+        import io
+        import os
+        import tempfile
+        from modules.services.file_service import FileService
+
+        class Upload:
+            """Streamed upload without getbuffer, so save_file copies it in chunks"""
+            def __init__(self, payload):
+                self.buffer = io.BytesIO(payload)
+                self.name = "participants.csv"
+                self.size = len(payload)
+
+            def read(self, size=-1):
+                return self.buffer.read(size)
+
+            def seek(self, offset, whence=0):
+                return self.buffer.seek(offset, whence)
+
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        service = FileService()
+        service.upload_base_dir = scratch.name
+        payload = b"name,email\n" * 200000
+        upload = Upload(payload)
+        upload.read(10)
+
+        result = service.save_file(upload, "participants", "spreadsheet")
+
+        self.assertTrue(result.is_valid)
+        self.assertEqual(os.listdir(os.path.dirname(result.file_path)), [result.file_name])
+        with open(result.file_path, "rb") as f:
+            self.assertEqual(f.read(), payload)
+
+    def test_list_files_skips_partial_writes(self):
+        """Test in-progress temporary files are not listed"""
+        import os
+        import tempfile
+        from modules.services.file_service import FileService
+
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        service = FileService()
+        service.upload_base_dir = scratch.name
+        directory = os.path.join(scratch.name, "media", "image")
+        os.makedirs(directory)
+        for name in ("photo.jpg", "upload.jpg.1234.tmp"):
+            open(os.path.join(directory, name), "wb").close()
+
+        self.assertEqual([f["name"] for f in service.list_files("media", "image")], ["photo.jpg"])
+
+    def test_cleanup_old_files(self):
+        """Test only files past the cutoff are removed"""
+        import os
+        import tempfile
+        import time
+        from modules.services.file_service import FileService
+
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        service = FileService()
+        service.upload_base_dir = scratch.name
+        nested = os.path.join(service.upload_base_dir, "media", "image")
+        os.makedirs(nested)
+        old_path = os.path.join(nested, "old.jpg")
+        new_path = os.path.join(service.upload_base_dir, "new.jpg")
+        for path in (old_path, new_path):
+            open(path, "wb").close()
+        stale = time.time() - 40 * 24 * 60 * 60
+        os.utime(old_path, (stale, stale))
+
+        self.assertEqual(service.cleanup_old_files(30), 1)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(new_path))
+
+class TestUploadHelpers(unittest.TestCase):
+    """Test upload helpers in modules.utils"""
+
+    def setUp(self):
+        """Create a scratch upload folder"""
+        import tempfile
+
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.folder = scratch.name
+
+    def make_upload(self, payload, name="photo.jpg", fail_after=None):
+        """Build a streamed upload that can fail after some reads"""
+        import io
+
+        class Upload:
+            def __init__(self):
+                self.buffer = io.BytesIO(payload)
+                self.name = name
+                self.size = len(payload)
+                self.type = "image/jpeg"
+                self.reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                if fail_after is not None and self.reads > fail_after:
+                    raise OSError("connection reset")
+                return self.buffer.read(size)
+
+            def seek(self, offset, whence=0):
+                return self.buffer.seek(offset, whence)
+
+        return Upload()
+
+    def test_failed_write_leaves_no_file(self):
+        """Test an interrupted write is not reused as a saved upload"""
+        import os
+        from modules.utils import save_uploaded_file
+
+        payload = os.urandom(3 << 20)
+        with self.assertRaises(OSError):
+            save_uploaded_file(self.make_upload(payload, fail_after=3), self.folder)
+        self.assertEqual(os.listdir(self.folder), [])
+
+        saved = save_uploaded_file(self.make_upload(payload), self.folder)
+        with open(saved["path"], "rb") as f:
+            self.assertEqual(f.read(), payload)
+
+    def test_resubmitted_upload_is_reused(self):
+        """Test the same upload saved twice maps to one file"""
+        import os
+        from modules.utils import save_uploaded_file
+
+        payload = b"\xff\xd8" + b"a" * 8192
+        first = save_uploaded_file(self.make_upload(payload), self.folder)
+        second = save_uploaded_file(self.make_upload(payload), self.folder)
+
+        self.assertEqual(first["path"], second["path"])
+        self.assertEqual(os.listdir(self.folder), [os.path.basename(first["path"])])
+
+    def test_corrected_upload_is_written(self):
+        """Test a re-upload with the same name and size but new content is saved"""
+        from modules.utils import save_uploaded_file
+
+        original = b"\xff\xd8" + b"a" * 8192
+        corrected = b"\xff\xd8" + b"a" * 8191 + b"b"
+        first = save_uploaded_file(self.make_upload(original), self.folder)
+        second = save_uploaded_file(self.make_upload(corrected), self.folder)
+
+        self.assertNotEqual(first["path"], second["path"])
+        with open(second["path"], "rb") as f:
+            self.assertEqual(f.read(), corrected)
+
+class TestFeedbackKeywords(unittest.TestCase):
+    """Test keyword matching for feedback comments"""
+
+    def setUp(self):
+        """Build comments with mixed case, regex characters and missing values"""
+        import pandas as pd
+
+        self.comments = pd.Series([
+            "Great VENUE and food",
+            "Loved the C++ workshop",
+            None,
+            float("nan"),
+            "Parking was a mess",
+        ])
+
+    def test_single_keyword_is_literal(self):
+        """Test one keyword matches case-insensitively without regex semantics"""
+        from modules.feedback import _keyword_mask
+
+        self.assertEqual(_keyword_mask(self.comments, ["c++"]).tolist(), [False, True, False, False, False])
+        self.assertEqual(_keyword_mask(self.comments, ["venue"]).tolist(), [True, False, False, False, False])
+
+    def test_multiple_keywords_regex_fallback(self):
+        """Test several keywords match any of them through the regex fallback"""
+        from unittest import mock
+        from modules import feedback
+
+        with mock.patch.object(feedback, "ahocorasick", None):
+            mask = feedback._keyword_mask(self.comments, ["venue", "C++", "parking"])
+
+        self.assertEqual(mask.tolist(), [True, True, False, False, True])
+
+    def test_multiple_keywords_automaton(self):
+        """Test the Aho-Corasick path agrees with the regex fallback"""
+        from unittest import mock
+        from modules import feedback
+
+        if feedback.ahocorasick is None:
+            self.skipTest("pyahocorasick is not installed")
+        keywords = ["venue", "C++", "parking"]
+        with mock.patch.object(feedback, "ahocorasick", None):
+            expected = feedback._keyword_mask(self.comments, keywords).tolist()
+
+        self.assertEqual(feedback._keyword_mask(self.comments, keywords).tolist(), expected)
+
 class TestModuleIntegration(unittest.TestCase):
     """Test module integration and imports"""
     